@@ -3,6 +3,7 @@ from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 from flask_cors import CORS
 from flask_jwt_extended import JWTManager
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.schedulers.background import BackgroundScheduler
 
 from app.config import config
@@ -13,39 +14,65 @@ jwt = JWTManager()
 scheduler = BackgroundScheduler()
 
 
-def create_app(config_name=None):
-    """Application factory pattern"""
+APP_ROLES = ('all', 'web', 'worker')
+
+
+def create_app(config_name=None, role=None):
+    """
+    Application factory pattern
+    
+    Args:
+        config_name: Configuration name (development/production)
+        role: 'all' serves the API and runs background jobs, 'web' only serves the API,
+              'worker' only runs background jobs (see worker.py). Defaults to APP_ROLE.
+    """
     if config_name is None:
         config_name = os.getenv('FLASK_ENV', 'development')
+    if role is None:
+        role = os.getenv('APP_ROLE', 'all')
+    if role not in APP_ROLES:
+        raise ValueError(f"Invalid app role '{role}'. Must be one of: {', '.join(APP_ROLES)}")
     
     app = Flask(__name__)
     app.config.from_object(config[config_name])
+    app.config['APP_ROLE'] = role
+    
+    # Workers get their own connection pool sized for their threads, so job
+    # threads firing together never wait out the pool timeout
+    if role == 'worker':
+        engine_options = dict(app.config['WORKER_SQLALCHEMY_ENGINE_OPTIONS'])
+        engine_options['pool_size'] = app.config['WORKER_DB_POOL_SIZE'] or (
+            app.config['SCHEDULER_MAX_WORKERS'] + app.config['FINALIZATION_WORKERS'] + 1
+        )
+        app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options
     
     # Initialize extensions with app
     db.init_app(app)
     jwt.init_app(app)
-    CORS(app, origins=app.config['CORS_ORIGINS'], supports_credentials=True)
     
-    # Register blueprints
-    from app.blueprints.auth import auth_bp
-    from app.blueprints.rumors import rumors_bp
-    from app.blueprints.voting import voting_bp
-    from app.blueprints.users import users_bp
-    from app.blueprints.admin import admin_bp
+    if role != 'worker':
+        CORS(app, origins=app.config['CORS_ORIGINS'], supports_credentials=True)
+        
+        # Register blueprints
+        from app.blueprints.auth import auth_bp
+        from app.blueprints.rumors import rumors_bp
+        from app.blueprints.voting import voting_bp
+        from app.blueprints.users import users_bp
+        from app.blueprints.admin import admin_bp
+        
+        app.register_blueprint(auth_bp, url_prefix='/api/auth')
+        app.register_blueprint(rumors_bp, url_prefix='/api/rumors')
+        app.register_blueprint(voting_bp, url_prefix='/api/voting')
+        app.register_blueprint(users_bp, url_prefix='/api/user')
+        app.register_blueprint(admin_bp, url_prefix='/api/admin')
+        
+        # Error handlers
+        from app.utils.error_handlers import register_error_handlers
+        register_error_handlers(app)
     
-    app.register_blueprint(auth_bp, url_prefix='/api/auth')
-    app.register_blueprint(rumors_bp, url_prefix='/api/rumors')
-    app.register_blueprint(voting_bp, url_prefix='/api/voting')
-    app.register_blueprint(users_bp, url_prefix='/api/user')
-    app.register_blueprint(admin_bp, url_prefix='/api/admin')
-    
-    # Register middleware
-    from app.middleware.nullifier import register_nullifier_middleware
-    register_nullifier_middleware(app)
-    
-    # Error handlers
-    from app.utils.error_handlers import register_error_handlers
-    register_error_handlers(app)
+    # Profile snapshot cache
+    from app.services.profile_cache import profile_cache
+    profile_cache.init_app(app)
     
     # Create tables and initialize blockchain
     with app.app_context():
@@ -53,11 +80,23 @@ def create_app(config_name=None):
         from app.services.blockchain import initialize_blockchain
         initialize_blockchain()
     
-    # Start background scheduler
-    if not scheduler.running:
-        from app.services.scheduler import setup_jobs
+    # Rumor lock deadlines are broadcast from every role, received by scheduler roles
+    from app.services.scheduler import init_lock_deadlines
+    init_lock_deadlines(app, listen=(role != 'web'))
+    
+    # Start background scheduler paused; it only runs jobs while this process is the leader
+    if role != 'web' and not scheduler.running:
+        from app.services.scheduler import setup_jobs, resume_jobs, pause_jobs, start_finalization_workers
+        from app.services.leader import start_leader_election
+        scheduler.configure(executors={
+            'default': ThreadPoolExecutor(app.config['SCHEDULER_MAX_WORKERS'])
+        })
         setup_jobs(app)
-        scheduler.start()
+        scheduler.start(paused=True)
+        start_leader_election(app, on_elected=resume_jobs, on_demoted=pause_jobs)
+        
+        # On PostgreSQL every scheduler-role process also drains the finalization queue
+        start_finalization_workers(app)
     
     @app.route('/api/health', methods=['GET'])
     def health_check():
@@ -4,6 +4,8 @@ from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identi
 from app import db
 from app.models import Admin, SecretKeyProfile
 from app.utils.error_handlers import APIError
+from app.services.blockchain import blockchain_service
+from app.services.profile_cache import profile_cache
 
 admin_bp = Blueprint('admin', __name__)
 
@@ -114,6 +116,7 @@ def unblock_user():
     # Unblock the profile
     profile.is_blocked = False
     db.session.commit()
+    profile_cache.invalidate([profile.id])
     
     return jsonify({
         'success': True,
@@ -129,7 +132,7 @@ def unblock_user():
 @admin_required
 def get_dashboard_stats():
     """Get overall platform statistics for admin dashboard"""
-    from app.models import User, Rumor, Vote, BlockchainLedger
+    from app.models import User, Rumor, Vote
     
     total_users = User.query.count()
     total_profiles = SecretKeyProfile.query.count()
@@ -142,7 +145,7 @@ def get_dashboard_stats():
     
     total_votes = Vote.query.count()  # Only active votes (deleted after finalization)
     
-    blockchain_blocks = BlockchainLedger.query.count()
+    blockchain_blocks = blockchain_service.get_ledger_counts()['total_blocks']
     
     return jsonify({
         'users': {
@@ -6,6 +6,7 @@ from app.models import User, SecretKeyProfile, Admin, AreaEnum
 from app.utils.validators import validate_area, validate_edu_email, validate_password
 from app.utils.helpers import generate_secret_key, hash_password, verify_password
 from app.utils.error_handlers import APIError
+from app.services.profile_cache import profile_cache
 from app.config import Config
 
 auth_bp = Blueprint('auth', __name__)
@@ -133,6 +134,7 @@ def register():
         
         db.session.add(user)
         db.session.commit()
+        profile_cache.invalidate([old_profile.id])
         
         return jsonify({
             'success': True,
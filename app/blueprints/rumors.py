@@ -2,14 +2,18 @@ from datetime import datetime
 import uuid
 from flask import Blueprint, request, jsonify, g
 from flask_jwt_extended import jwt_required, get_jwt_identity
+from sqlalchemy import tuple_
 from app import db
-from app.models import Rumor, SecretKeyProfile, AreaEnum
+from app.models import Rumor, SecretKeyProfile, VoteTally, AreaEnum
 from app.utils.validators import validate_rumor_content, validate_area
-from app.utils.helpers import generate_nullifier, hash_data
+from app.utils.helpers import generate_nullifier, hash_data, encode_cursor, decode_cursor
 from app.utils.error_handlers import APIError
 from app.services.ai_service import ai_service
 from app.services.blockchain import blockchain_service
+from app.services.profile_cache import profile_cache
+from app.services.scheduler import schedule_rumor_lock
 from app.middleware.nullifier import nullifier_required
+from app.config import Config
 
 rumors_bp = Blueprint('rumors', __name__)
 
@@ -70,14 +74,15 @@ def create_rumor():
     
     if not validation['isValid']:
         # Deduct points for posting invalid rumor
-        from app.config import Config
-        profile.points += Config.INVALID_RUMOR_PENALTY
+        poster = profile.load()
+        poster.points += Config.INVALID_RUMOR_PENALTY
         
         # Check if user should be blocked
-        if profile.points <= Config.BLOCKING_THRESHOLD:
-            profile.is_blocked = True
+        if poster.points <= Config.BLOCKING_THRESHOLD:
+            poster.is_blocked = True
         
         db.session.commit()
+        profile_cache.invalidate([poster.id])
         
         raise APIError(
             f"Rumor validation failed: {validation['reason']}",
@@ -85,7 +90,7 @@ def create_rumor():
             400
         )
     
-    # Get previous hash from blockchain
+    # Get previous hash from the chain head (one primary-key read)
     previous_hash = blockchain_service.get_last_block_hash()
     if previous_hash is None:
         previous_hash = blockchain_service.get_genesis_hash()
@@ -115,8 +120,12 @@ def create_rumor():
     )
     
     db.session.add(rumor)
+    db.session.add(VoteTally(rumor_id=rumor_id))
     db.session.commit()
     
+    # Lock the rumor as soon as its voting period ends
+    schedule_rumor_lock(rumor.id, rumor.voting_ends_at)
+    
     return jsonify({
         'rumor': rumor.to_dict(include_stats=True),
         'validation': validation
@@ -126,14 +135,30 @@ def create_rumor():
 @rumors_bp.route('', methods=['GET'])
 def get_rumors():
     """
-    Get list of rumors with optional filters
+    Get a page of rumors with optional filters
     
     Note: Users can see ALL rumors regardless of area.
     When voting, if rumor.area_of_vote matches user.area, it's "within area" (higher weight).
     Otherwise, it's "not within area" (lower weight).
+    
+    Uses keyset pagination over (posted_at, id): pass the returned
+    nextCursor back as ?cursor= to fetch the next page.
     """
     # Query parameters
     status = request.args.get('status')  # 'active', 'locked', 'final'
+    cursor = request.args.get('cursor')
+    
+    try:
+        limit = int(request.args.get('limit', Config.RUMORS_PAGE_SIZE))
+    except ValueError:
+        raise APIError("limit must be an integer", "INVALID_LIMIT", 400)
+    
+    if limit < 1 or limit > Config.RUMORS_MAX_PAGE_SIZE:
+        raise APIError(
+            f"limit must be between 1 and {Config.RUMORS_MAX_PAGE_SIZE}",
+            "INVALID_LIMIT",
+            400
+        )
     
     # Build query - show ALL rumors to everyone
     query = Rumor.query
@@ -144,15 +169,41 @@ def get_rumors():
     elif status == 'locked':
         query = query.filter_by(is_locked=True, is_final=False)
     elif status == 'final':
-        query = query.filter_by(is_final=True)
+        # Finalized rumors are always locked; matching both keeps the
+        # (is_final, is_locked, posted_at, id) index usable for the ordering
+        query = query.filter_by(is_final=True, is_locked=True)
+    
+    # Resume after the last row of the previous page
+    if cursor:
+        try:
+            cursor_posted_at, cursor_id = decode_cursor(cursor)
+        except ValueError:
+            raise APIError("Invalid cursor", "INVALID_CURSOR", 400)
+        query = query.filter(
+            tuple_(Rumor.posted_at, Rumor.id) < tuple_(cursor_posted_at, cursor_id)
+        )
+    
+    # Order by posted date (newest first), id breaks ties
+    query = query.order_by(Rumor.posted_at.desc(), Rumor.id.desc())
+    
+    # Fetch one extra row to know whether another page exists
+    rumors = query.limit(limit + 1).all()
+    has_more = len(rumors) > limit
+    rumors = rumors[:limit]
     
-    # Order by posted date (newest first)
-    query = query.order_by(Rumor.posted_at.desc())
+    next_cursor = None
+    if has_more:
+        last = rumors[-1]
+        next_cursor = encode_cursor(last.posted_at, last.id)
     
-    rumors = query.all()
+    # Load stats for finalized rumors without a snapshot in one query
+    stats = Rumor.get_stats_for(
+        rumor.id for rumor in rumors if rumor.is_final and rumor.final_stats is None
+    )
     
     return jsonify({
-        'rumors': [rumor.to_dict(include_stats=True) for rumor in rumors]
+        'rumors': [rumor.to_dict(include_stats=True, stats=stats.get(rumor.id)) for rumor in rumors],
+        'nextCursor': next_cursor
     }), 200
 
 
@@ -194,3 +245,25 @@ def get_rumor_stats(rumor_id):
         }
     
     return jsonify(stats), 200
+
+
+@rumors_bp.route('/<rumor_id>/proof', methods=['GET'])
+def get_rumor_proof(rumor_id):
+    """Get the Merkle inclusion proof for a finalized rumor's ledger block"""
+    rumor = Rumor.query.get(rumor_id)
+    
+    if not rumor:
+        raise APIError("Rumor not found", "RUMOR_NOT_FOUND", 404)
+    
+    if not rumor.is_final:
+        raise APIError("Rumor has not been finalized yet", "RUMOR_NOT_FINALIZED", 400)
+    
+    proof = blockchain_service.get_inclusion_proof(rumor_id)
+    if proof is None:
+        raise APIError(
+            "No inclusion proof for this rumor: its block is not sealed into a Merkle block",
+            "PROOF_NOT_AVAILABLE",
+            404
+        )
+    
+    return jsonify(proof), 200
@@ -45,8 +45,13 @@ def get_user_rumors():
     
     rumors = Rumor.query.filter_by(profile_id=profile.id).order_by(Rumor.posted_at.desc()).all()
     
+    # Load stats for finalized rumors without a snapshot in one query
+    stats = Rumor.get_stats_for(
+        rumor.id for rumor in rumors if rumor.is_final and rumor.final_stats is None
+    )
+    
     return jsonify({
-        'rumors': [rumor.to_dict(include_stats=True) for rumor in rumors]
+        'rumors': [rumor.to_dict(include_stats=True, stats=stats.get(rumor.id)) for rumor in rumors]
     }), 200
 
 
@@ -54,7 +59,7 @@ def get_user_rumors():
 @nullifier_required
 def get_profile():
     """Get current profile"""
-    profile = g.current_profile
+    profile = g.current_profile.load()
     
     return jsonify({
         'profile': profile.to_dict()
@@ -1,15 +1,57 @@
 from datetime import datetime
+import uuid
 from flask import Blueprint, request, jsonify, g
 from flask_jwt_extended import jwt_required, get_jwt_identity
+from sqlalchemy import tuple_
+from sqlalchemy.exc import IntegrityError
 from app import db
 from app.models import Rumor, Vote, SecretKeyProfile, VoteTypeEnum
 from app.utils.helpers import calculate_vote_weight
 from app.utils.error_handlers import APIError
 from app.middleware.nullifier import nullifier_required, generate_vote_nullifier
+from app.services.tally import tally_service
+from app.config import Config
 
 voting_bp = Blueprint('voting', __name__)
 
 
+def insert_votes(rows):
+    """
+    Insert vote rows, skipping any that hit the unique_vote_per_rumor constraint
+    
+    Uses INSERT ... ON CONFLICT DO NOTHING so duplicate detection is a single
+    atomic statement instead of a racy check-then-insert.
+    
+    Returns:
+        Set of rumor IDs whose vote was inserted
+    """
+    if not rows:
+        return set()
+    
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        # No ON CONFLICT support: insert row by row inside savepoints
+        inserted = set()
+        for row in rows:
+            try:
+                with db.session.begin_nested():
+                    db.session.execute(Vote.__table__.insert().values(**row))
+                inserted.add(row['rumor_id'])
+            except IntegrityError:
+                pass
+        return inserted
+    
+    stmt = insert(Vote.__table__).values(rows).on_conflict_do_nothing(
+        index_elements=['rumor_id', 'nullifier']
+    ).returning(Vote.__table__.c.rumor_id)
+    
+    return {rumor_id for (rumor_id,) in db.session.execute(stmt)}
+
+
 @voting_bp.route('/vote', methods=['POST'])
 @nullifier_required
 def cast_vote():
@@ -59,34 +101,32 @@ def cast_vote():
     # Generate nullifier
     nullifier = generate_vote_nullifier(secret_key, rumor_id)
     
-    # Check for duplicate vote
-    existing_vote = Vote.query.filter_by(
-        rumor_id=rumor_id,
-        nullifier=nullifier
-    ).first()
-    
-    if existing_vote:
-        raise APIError(
-            "You have already voted on this rumor",
-            "DUPLICATE_VOTE",
-            400
-        )
-    
     # Calculate vote weight (within area = 1.0, not within area = 0.3)
     vote_weight = calculate_vote_weight(profile.area, rumor.area_of_vote)
+    is_within_area = (profile.area == rumor.area_of_vote)
     
     try:
-        # Create vote
-        vote = Vote(
-            rumor_id=rumor_id,
-            profile_id=profile.id,
-            vote_type=VoteTypeEnum[vote_type],
-            weight=vote_weight,
-            is_within_area=(profile.area == rumor.area_of_vote),
-            nullifier=nullifier
-        )
+        # Insert vote; the unique_vote_per_rumor constraint rejects duplicates
+        vote = {
+            'id': str(uuid.uuid4()),
+            'rumor_id': rumor_id,
+            'profile_id': profile.id,
+            'vote_type': VoteTypeEnum[vote_type],
+            'weight': vote_weight,
+            'is_within_area': is_within_area,
+            'nullifier': nullifier,
+            'timestamp': datetime.utcnow()
+        }
         
-        db.session.add(vote)
+        if not insert_votes([vote]):
+            db.session.rollback()
+            raise APIError(
+                "You have already voted on this rumor",
+                "DUPLICATE_VOTE",
+                400
+            )
+        
+        tally_service.record_vote(rumor_id, vote['vote_type'], vote_weight, is_within_area)
         db.session.commit()
         
         return jsonify({
@@ -95,10 +135,12 @@ def cast_vote():
                 'rumorId': rumor_id,
                 'voteType': vote_type,
                 'weight': vote_weight,
-                'isWithinArea': vote.is_within_area,
-                'timestamp': vote.timestamp.isoformat()
+                'isWithinArea': is_within_area,
+                'timestamp': vote['timestamp'].isoformat()
             }
         }), 201
+    except APIError:
+        raise
     except Exception as e:
         db.session.rollback()
         print(f"Error creating vote: {str(e)}")
@@ -156,34 +198,31 @@ def vote_on_rumor(rumor_id):
     # Generate nullifier for this vote
     nullifier = generate_vote_nullifier(secret_key, rumor_id)
     
-    # Check if profile already voted (using nullifier)
-    existing_vote = Vote.query.filter_by(
-        rumor_id=rumor_id,
-        nullifier=nullifier
-    ).first()
+    # Calculate vote weight
+    is_within_area = (profile.area == rumor.area_of_vote)
+    weight = calculate_vote_weight(profile.area, rumor.area_of_vote)
+    
+    # Insert vote; the unique_vote_per_rumor constraint rejects duplicates
+    inserted = insert_votes([{
+        'id': str(uuid.uuid4()),
+        'rumor_id': rumor_id,
+        'profile_id': profile.id,
+        'nullifier': nullifier,
+        'vote_type': VoteTypeEnum(vote_type),
+        'weight': weight,
+        'is_within_area': is_within_area,
+        'timestamp': datetime.utcnow()
+    }])
     
-    if existing_vote:
+    if not inserted:
+        db.session.rollback()
         raise APIError(
             "You have already voted on this rumor",
             "ALREADY_VOTED",
             400
         )
     
-    # Calculate vote weight
-    is_within_area = (profile.area == rumor.area_of_vote)
-    weight = calculate_vote_weight(profile.area, rumor.area_of_vote)
-    
-    # Create vote
-    vote = Vote(
-        rumor_id=rumor_id,
-        profile_id=profile.id,
-        nullifier=nullifier,
-        vote_type=VoteTypeEnum(vote_type),
-        weight=weight,
-        is_within_area=is_within_area
-    )
-    
-    db.session.add(vote)
+    tally_service.record_vote(rumor_id, VoteTypeEnum(vote_type), weight, is_within_area)
     db.session.commit()
     
     return jsonify({
@@ -194,6 +233,122 @@ def vote_on_rumor(rumor_id):
     }), 201
 
 
+@voting_bp.route('/votes:batch', methods=['POST'])
+@nullifier_required
+def cast_votes_batch():
+    """
+    Vote on many rumors in one request
+    
+    Request body:
+        {'votes': [{'rumorId': str, 'voteType': 'FACT' | 'LIE'}, ...]}
+    
+    Each item succeeds or fails independently; the response lists a result per item
+    in request order.
+    """
+    profile = g.current_profile
+    secret_key = g.secret_key
+    
+    data = request.get_json()
+    
+    if not data:
+        raise APIError("Request body is required", "INVALID_REQUEST", 400)
+    
+    items = data.get('votes')
+    if not isinstance(items, list) or not items:
+        raise APIError("votes must be a non-empty list", "INVALID_REQUEST", 400)
+    
+    if len(items) > Config.MAX_BATCH_VOTES:
+        raise APIError(
+            f"A batch may contain at most {Config.MAX_BATCH_VOTES} votes",
+            "BATCH_TOO_LARGE",
+            400
+        )
+    
+    # Validate all referenced rumors with one query
+    rumor_ids = {
+        item.get('rumorId') for item in items
+        if isinstance(item, dict) and isinstance(item.get('rumorId'), str)
+    }
+    rumors = {
+        rumor.id: rumor
+        for rumor in Rumor.query.filter(Rumor.id.in_(rumor_ids)).all()
+    } if rumor_ids else {}
+    
+    now = datetime.utcnow()
+    results = []
+    rows = []
+    seen = set()
+    
+    for item in items:
+        rumor_id = item.get('rumorId') if isinstance(item, dict) else None
+        if not isinstance(rumor_id, str):
+            rumor_id = None
+        vote_type = item.get('voteType', '') if isinstance(item, dict) else ''
+        vote_type = vote_type.upper() if isinstance(vote_type, str) else ''
+        result = {'rumorId': rumor_id, 'success': False}
+        results.append(result)
+        
+        if not rumor_id:
+            result.update(code='INVALID_REQUEST', message='rumorId must be a non-empty string')
+            continue
+        
+        rumor = rumors.get(rumor_id)
+        if vote_type not in [VoteTypeEnum.FACT.value, VoteTypeEnum.LIE.value]:
+            result.update(code='INVALID_VOTE_TYPE', message="Invalid vote type. Must be 'FACT' or 'LIE'")
+        elif not rumor:
+            result.update(code='RUMOR_NOT_FOUND', message='Rumor not found')
+        elif rumor.is_locked:
+            result.update(code='VOTING_CLOSED', message='Voting is closed for this rumor')
+        elif rumor.voting_ends_at < now:
+            result.update(code='VOTING_ENDED', message='Voting period has ended for this rumor')
+        elif rumor_id in seen:
+            result.update(code='DUPLICATE_VOTE', message='You have already voted on this rumor')
+        else:
+            seen.add(rumor_id)
+            is_within_area = (profile.area == rumor.area_of_vote)
+            row = {
+                'id': str(uuid.uuid4()),
+                'rumor_id': rumor_id,
+                'profile_id': profile.id,
+                'nullifier': generate_vote_nullifier(secret_key, rumor_id),
+                'vote_type': VoteTypeEnum(vote_type),
+                'weight': calculate_vote_weight(profile.area, rumor.area_of_vote),
+                'is_within_area': is_within_area,
+                'timestamp': now
+            }
+            rows.append(row)
+            result['vote'] = row
+    
+    # Single multi-row insert; conflicts mean the profile already voted
+    inserted = insert_votes(rows)
+    tally_service.record_votes(row for row in rows if row['rumor_id'] in inserted)
+    db.session.commit()
+    
+    recorded = 0
+    for result in results:
+        row = result.pop('vote', None)
+        if row is None:
+            continue
+        if row['rumor_id'] in inserted:
+            recorded += 1
+            result['success'] = True
+            result['vote'] = {
+                'rumorId': row['rumor_id'],
+                'voteType': row['vote_type'].value,
+                'weight': row['weight'],
+                'isWithinArea': row['is_within_area'],
+                'timestamp': row['timestamp'].isoformat()
+            }
+        else:
+            result.update(code='DUPLICATE_VOTE', message='You have already voted on this rumor')
+    
+    return jsonify({
+        'results': results,
+        'recorded': recorded,
+        'failed': len(results) - recorded
+    }), 200
+
+
 @voting_bp.route('/status/<rumor_id>', methods=['GET'])
 @nullifier_required
 def check_vote_status(rumor_id):
@@ -220,6 +375,49 @@ def check_vote_status(rumor_id):
     }), 200
 
 
+@voting_bp.route('/status:batch', methods=['POST'])
+@nullifier_required
+def check_vote_status_batch():
+    """
+    Check which of many rumors the user has voted on (doesn't reveal vote details)
+    
+    Request body:
+        {'rumorIds': [str, ...]}
+    
+    Unknown rumor IDs are reported as not voted.
+    """
+    secret_key = g.secret_key
+    
+    data = request.get_json()
+    
+    if not data:
+        raise APIError("Request body is required", "INVALID_REQUEST", 400)
+    
+    rumor_ids = data.get('rumorIds')
+    if not isinstance(rumor_ids, list) or not all(isinstance(r, str) for r in rumor_ids):
+        raise APIError("rumorIds must be a list of rumor IDs", "INVALID_REQUEST", 400)
+    
+    if len(rumor_ids) > Config.MAX_BATCH_STATUS_IDS:
+        raise APIError(
+            f"A batch may contain at most {Config.MAX_BATCH_STATUS_IDS} rumor IDs",
+            "BATCH_TOO_LARGE",
+            400
+        )
+    
+    # One IN query over the (rumor_id, nullifier) unique index
+    keys = [(rumor_id, generate_vote_nullifier(secret_key, rumor_id)) for rumor_id in set(rumor_ids)]
+    voted = {
+        rumor_id for (rumor_id,) in
+        db.session.query(Vote.rumor_id).filter(
+            tuple_(Vote.rumor_id, Vote.nullifier).in_(keys)
+        ).all()
+    } if keys else set()
+    
+    return jsonify({
+        'statuses': {rumor_id: rumor_id in voted for rumor_id in rumor_ids}
+    }), 200
+
+
 @voting_bp.route('/rumors/<rumor_id>/vote-status', methods=['GET'])
 @nullifier_required
 def get_vote_status(rumor_id):
@@ -1,4 +1,5 @@
 import os
+import tempfile
 from datetime import timedelta
 from dotenv import load_dotenv
 
@@ -15,6 +16,15 @@ class Config:
         'pool_recycle': 300,
     }
     
+    # Connection pool for the standalone background worker (worker.py); create_app
+    # sizes it to one connection per job, finalization and election thread
+    WORKER_SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_pre_ping': True,
+        'pool_recycle': 300,
+        'max_overflow': 0
+    }
+    WORKER_DB_POOL_SIZE = int(os.getenv('WORKER_DB_POOL_SIZE', 0))  # 0 sizes the pool to the worker's threads
+    
     # JWT Configuration
     JWT_SECRET_KEY = os.getenv('JWT_SECRET', 'dev-secret-key-change-in-production')
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(days=30)
@@ -25,6 +35,14 @@ class Config:
     # CORS Configuration
     CORS_ORIGINS = os.getenv('CORS_ORIGINS', 'http://localhost:3000').split(',')
     
+    # Profile Cache Configuration
+    PROFILE_CACHE_TTL_SECONDS = int(os.getenv('PROFILE_CACHE_TTL_SECONDS', 30))  # 0 disables the cache
+    PROFILE_CACHE_MAX_SIZE = int(os.getenv('PROFILE_CACHE_MAX_SIZE', 10000))
+    # 'postgres' (LISTEN/NOTIFY, reaches every process) or 'local' (single process only)
+    PROFILE_CACHE_BACKEND = os.getenv('PROFILE_CACHE_BACKEND') or (
+        'postgres' if SQLALCHEMY_DATABASE_URI.startswith('postgres') else 'local'
+    )
+    
     # Azure OpenAI Configuration
     AZURE_OPENAI_ENDPOINT = os.getenv('AZURE_OPENAI_ENDPOINT')
     AZURE_OPENAI_API_KEY = os.getenv('AZURE_OPENAI_API_KEY')
@@ -36,9 +54,44 @@ class Config:
     
     # Voting Configuration
     VOTING_DURATION_HOURS = 48
-    VOTING_CHECK_INTERVAL_MINUTES = 5
+    LOCK_DEADLINE_GRACE_SECONDS = 5  # Lock this long after voting_ends_at so in-flight votes land
+    LOCK_DEADLINE_RESYNC_MINUTES = 15  # Reload deadlines changed outside the API
+    LOCK_RECHECK_MINUTES = 5  # One re-check of a rumor that missed the threshold, for votes still committing
+    LOCK_RETRY_TERMINAL_POLICY = os.getenv('LOCK_RETRY_TERMINAL_POLICY', 'retire')  # 'retire' or 'lock' (hand to finalization)
     FINALIZATION_CHECK_INTERVAL_MINUTES = 10
+    MAX_VOTING_EXTENSIONS = int(os.getenv('MAX_VOTING_EXTENSIONS', 2))  # Then the vote weights decide without asking the AI
+    FINALIZATION_BATCH_SIZE = 50  # Finalization tasks claimed (and moderated) per chunk
+    FINALIZATION_MAX_ATTEMPTS = 5  # Failed tasks stay in finalization_tasks with their last error after this
+    FINALIZATION_RETRY_BASE_SECONDS = 60  # Backoff after a failed attempt, doubling each time
+    FINALIZATION_VISIBILITY_TIMEOUT_SECONDS = 600  # A claimed task is retried if its worker is gone this long
+    FINALIZATION_WORKERS = int(os.getenv('FINALIZATION_WORKERS', 1))  # Queue consumer threads per process (PostgreSQL only)
+    FINALIZATION_POLL_SECONDS = 10
+    AI_MODERATION_MAX_WORKERS = int(os.getenv('AI_MODERATION_MAX_WORKERS', 8))  # Concurrent AI calls per finalization run
+    AI_MODERATION_TIMEOUT_SECONDS = int(os.getenv('AI_MODERATION_TIMEOUT_SECONDS', 30))  # Falls back to rule-based moderation
+    
+    # Scheduler Threads (the worker's connection pool is sized to fit them)
+    SCHEDULER_MAX_WORKERS = int(os.getenv('SCHEDULER_MAX_WORKERS', 10))
+    
+    # Scheduler Leader Election (only the leader process runs background jobs)
+    SCHEDULER_LEADER_ELECTION_INTERVAL_SECONDS = 15
+    SCHEDULER_LEADER_LOCK_KEY = 7_240_511  # PostgreSQL advisory lock key
+    SCHEDULER_LEADER_LOCK_FILE = os.getenv(
+        'SCHEDULER_LEADER_LOCK_FILE',
+        os.path.join(tempfile.gettempdir(), 'veranode-scheduler.lock')
+    )  # Used when the database is not PostgreSQL
     WITHIN_AREA_THRESHOLD = 0.3  # 30% of votes must be within area
+    MAX_BATCH_VOTES = 100  # Max votes accepted by one batch request
+    MAX_BATCH_STATUS_IDS = 200  # Max rumor IDs accepted by one batch status request
+    
+    # Ledger Verification Configuration
+    LEDGER_VERIFY_BATCH_SIZE = 1000  # Blocks fetched per round trip while walking the chain
+    LEDGER_AUDIT_SHARD_SIZE = 50000  # Blocks per process-pool task in a full hash audit
+    LEDGER_APPEND_LOCK_KEY = 7_240_512  # PostgreSQL advisory lock key held while appending a block
+    LEDGER_BLOCK_MODE = os.getenv('LEDGER_BLOCK_MODE', 'chain')  # 'chain' (block per rumor) or 'merkle' (block per run)
+    
+    # Pagination Configuration
+    RUMORS_PAGE_SIZE = 20
+    RUMORS_MAX_PAGE_SIZE = 100
     
     # Points Configuration
     INITIAL_USER_POINTS = 100
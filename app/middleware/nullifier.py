@@ -1,7 +1,7 @@
 from functools import wraps
 from flask import request, g
 from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
-from app.models import SecretKeyProfile
+from app.services.profile_cache import profile_cache
 from app.utils.helpers import generate_nullifier
 from app.utils.error_handlers import APIError
 
@@ -37,7 +37,7 @@ def nullifier_required(f):
             )
         
         # Get profile with secret key
-        profile = SecretKeyProfile.query.filter_by(secret_key=secret_key).first()
+        profile = resolve_profile(secret_key)
         if not profile:
             raise APIError("Invalid secret key", "INVALID_SECRET_KEY", 401)
         
@@ -57,42 +57,25 @@ def nullifier_required(f):
     return decorated_function
 
 
+def resolve_profile(secret_key: str):
+    """
+    Look up the profile snapshot for a secret key at most once per request
+    
+    The result (including a miss) is memoized on flask.g; across requests the
+    snapshot comes from the process-wide profile cache.
+    """
+    resolved = g.get('_resolved_profile')
+    if resolved is not None and resolved[0] == secret_key:
+        return resolved[1]
+    
+    profile = profile_cache.get(secret_key)
+    g._resolved_profile = (secret_key, profile)
+    return profile
+
+
 def generate_vote_nullifier(secret_key: str, rumor_id: str) -> str:
     """
     Generate deterministic nullifier for a vote
     This ensures privacy while preventing double-voting
     """
     return generate_nullifier(secret_key, rumor_id)
-
-
-def register_nullifier_middleware(app):
-    """Register nullifier-related middleware with the app"""
-    
-    @app.before_request
-    def check_profile_block_status():
-        """Check if profile is blocked on protected routes"""
-        # Only check on API routes that require authentication
-        if request.path.startswith('/api/') and request.path not in [
-            '/api/health',
-            '/api/auth/register',
-            '/api/auth/login'
-        ]:
-            # Check if there's a valid JWT
-            try:
-                verify_jwt_in_request(optional=True)
-                secret_key = get_jwt_identity()
-                if secret_key:
-                    profile = SecretKeyProfile.query.filter_by(secret_key=secret_key).first()
-                    if profile and profile.is_blocked:
-                        # Allow read-only operations for blocked users
-                        if request.method not in ['GET', 'HEAD', 'OPTIONS']:
-                            raise APIError(
-                                "Your account is blocked due to low reputation points. You can view content but cannot post or vote.",
-                                "ACCOUNT_BLOCKED",
-                                403
-                            )
-            except:
-                # If JWT verification fails, let the route handle it
-                pass
-    
-    print("✓ Nullifier middleware registered")
@@ -124,6 +124,12 @@ class Rumor(db.Model):
     is_locked = db.Column(db.Boolean, default=False, nullable=False)
     is_final = db.Column(db.Boolean, default=False, nullable=False)
     final_decision = db.Column(db.Enum(DecisionEnum), nullable=True)
+    final_stats = db.Column(db.JSON, nullable=True)  # Vote tallies captured at finalization
+    lock_attempts = db.Column(db.Integer, default=0, nullable=False)  # Lock checks that missed the threshold
+    lock_evaluated_at = db.Column(db.DateTime, nullable=True)
+    lock_next_eligible_at = db.Column(db.DateTime, nullable=True)  # NULL once evaluated = retired
+    extension_count = db.Column(db.Integer, default=0, nullable=False)  # AI-requested voting extensions
+    extension_history = db.Column(db.JSON, nullable=True)  # [{extendedAt, previousVotingEndsAt, votingEndsAt, reason}]
     nullifier = db.Column(db.String(64), nullable=False, unique=True)  # For privacy
     previous_hash = db.Column(db.String(64), nullable=True)  # Blockchain linkage
     current_hash = db.Column(db.String(64), nullable=False, unique=True)
@@ -132,6 +138,15 @@ class Rumor(db.Model):
     # Relationships
     profile = db.relationship('SecretKeyProfile', back_populates='rumors')
     votes = db.relationship('Vote', back_populates='rumor', lazy='dynamic', cascade='all, delete-orphan')
+    tally = db.relationship('VoteTally', back_populates='rumor', uselist=False, cascade='all, delete-orphan')
+    finalization_task = db.relationship('FinalizationTask', back_populates='rumor', uselist=False, cascade='all, delete-orphan')
+    
+    # Composite indexes backing keyset pagination over (posted_at, id)
+    __table_args__ = (
+        db.Index('ix_rumors_posted_at_id', 'posted_at', 'id'),
+        db.Index('ix_rumors_status_posted_at_id', 'is_final', 'is_locked', 'posted_at', 'id'),
+        db.Index('ix_rumors_lock_deadline', 'is_locked', 'is_final', 'voting_ends_at'),
+    )
     
     def __init__(self, **kwargs):
         super(Rumor, self).__init__(**kwargs)
@@ -144,7 +159,33 @@ class Rumor(db.Model):
             if not self.posted_at:
                 self.posted_at = posted_time
     
-    def to_dict(self, include_stats=False):
+    def reset_lock_backoff(self):
+        """Make the rumor eligible for lock evaluation again after its voting window moves"""
+        self.lock_attempts = 0
+        self.lock_evaluated_at = None
+        self.lock_next_eligible_at = None
+    
+    def record_extension(self, voting_ends_at, reason):
+        """Move the voting deadline for an AI-requested extension and keep a history entry"""
+        entry = {
+            'extendedAt': datetime.utcnow().isoformat(),
+            'previousVotingEndsAt': self.voting_ends_at.isoformat(),
+            'votingEndsAt': voting_ends_at.isoformat(),
+            'reason': reason
+        }
+        # Reassign so the JSON column is flagged as changed
+        self.extension_history = (self.extension_history or []) + [entry]
+        self.extension_count = (self.extension_count or 0) + 1
+        self.voting_ends_at = voting_ends_at
+    
+    def to_dict(self, include_stats=False, stats=None):
+        """
+        Serialize the rumor
+        
+        Args:
+            include_stats: Include voting statistics (hidden until finalized)
+            stats: Pre-computed stats from Rumor.get_stats_for(), avoids a per-rumor query
+        """
         data = {
             'id': self.id,
             'content': self.content,
@@ -153,6 +194,7 @@ class Rumor(db.Model):
             'votingEndsAt': self.voting_ends_at.isoformat(),
             'isLocked': self.is_locked,
             'isFinal': self.is_final,
+            'extensionCount': self.extension_count or 0,
             'finalDecision': self.final_decision.value if self.final_decision else None,
             'currentHash': self.current_hash,
             'previousHash': self.previous_hash
@@ -160,8 +202,7 @@ class Rumor(db.Model):
         
         # Only show stats when rumor is finalized (prevent psychological influence during voting)
         if include_stats and self.is_final:
-            stats = self.get_stats()
-            data['stats'] = stats
+            data['stats'] = stats if stats is not None else self.get_stats()
         elif include_stats and not self.is_final:
             # Return hidden stats during active/locked voting
             data['stats'] = {
@@ -178,27 +219,42 @@ class Rumor(db.Model):
         return data
     
     def get_stats(self):
-        """Calculate voting statistics"""
-        votes = self.votes.all()
-        total_votes = len(votes)
-        fact_votes = sum(1 for v in votes if v.vote_type == VoteTypeEnum.FACT)
-        lie_votes = sum(1 for v in votes if v.vote_type == VoteTypeEnum.LIE)
-        fact_weight = sum(v.weight for v in votes if v.vote_type == VoteTypeEnum.FACT)
-        lie_weight = sum(v.weight for v in votes if v.vote_type == VoteTypeEnum.LIE)
-        under_area_votes = sum(1 for v in votes if v.is_within_area)
-        not_under_area_votes = sum(1 for v in votes if not v.is_within_area)
+        """Calculate voting statistics (finalized rumors use their stored snapshot)"""
+        if self.final_stats is not None:
+            return self.final_stats
+        return Rumor.get_stats_for([self.id])[self.id]
+    
+    @staticmethod
+    def get_stats_for(rumor_ids):
+        """Read voting statistics for many rumors from their running tallies in one query"""
+        rumor_ids = list(rumor_ids)
+        if not rumor_ids:
+            return {}
         
+        tallies = VoteTally.query.filter(VoteTally.rumor_id.in_(rumor_ids)).all()
+        
+        stats = {rumor_id: Rumor._build_stats() for rumor_id in rumor_ids}
+        for tally in tallies:
+            stats[tally.rumor_id] = tally.to_stats()
+        return stats
+    
+    @staticmethod
+    def _build_stats(total_votes=0, fact_votes=0, lie_votes=0, fact_weight=0.0,
+                     lie_weight=0.0, under_area_votes=0, not_under_area_votes=0):
+        """Shape raw vote aggregates into the public stats dictionary"""
+        fact_weight = float(fact_weight or 0)
+        lie_weight = float(lie_weight or 0)
         total_weight = fact_weight + lie_weight
         progress = int((fact_weight / total_weight * 100)) if total_weight > 0 else 0
         
         return {
-            'totalVotes': total_votes,
-            'factVotes': fact_votes,
-            'lieVotes': lie_votes,
-            'factWeight': float(fact_weight),
-            'lieWeight': float(lie_weight),
-            'underAreaVotes': under_area_votes,
-            'notUnderAreaVotes': not_under_area_votes,
+            'totalVotes': int(total_votes or 0),
+            'factVotes': int(fact_votes or 0),
+            'lieVotes': int(lie_votes or 0),
+            'factWeight': fact_weight,
+            'lieWeight': lie_weight,
+            'underAreaVotes': int(under_area_votes or 0),
+            'notUnderAreaVotes': int(not_under_area_votes or 0),
             'progress': progress
         }
     
@@ -241,6 +297,59 @@ class Vote(db.Model):
         return f'<Vote {self.vote_type.value} on {self.rumor_id[:8]}...>'
 
 
+class VoteTally(db.Model):
+    """Running per-rumor vote totals, updated in the same transaction as each vote insert"""
+    __tablename__ = 'vote_tallies'
+    
+    rumor_id = db.Column(db.String(36), db.ForeignKey('rumors.id'), primary_key=True)
+    fact_votes = db.Column(db.Integer, default=0, nullable=False)
+    lie_votes = db.Column(db.Integer, default=0, nullable=False)
+    fact_weight = db.Column(db.Float, default=0.0, nullable=False)
+    lie_weight = db.Column(db.Float, default=0.0, nullable=False)
+    under_area_votes = db.Column(db.Integer, default=0, nullable=False)
+    not_under_area_votes = db.Column(db.Integer, default=0, nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    
+    # Relationships
+    rumor = db.relationship('Rumor', back_populates='tally')
+    
+    def to_stats(self):
+        return Rumor._build_stats(
+            self.fact_votes + self.lie_votes,
+            self.fact_votes,
+            self.lie_votes,
+            self.fact_weight,
+            self.lie_weight,
+            self.under_area_votes,
+            self.not_under_area_votes
+        )
+    
+    def __repr__(self):
+        return f'<VoteTally {self.rumor_id[:8]}...>'
+
+
+class FinalizationTask(db.Model):
+    """Durable queue entry for a locked rumor awaiting finalization, deleted once it is processed"""
+    __tablename__ = 'finalization_tasks'
+    
+    rumor_id = db.Column(db.String(36), db.ForeignKey('rumors.id'), primary_key=True)
+    attempts = db.Column(db.Integer, default=0, nullable=False)
+    available_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)  # Claimable from; pushed out while claimed
+    claimed_by = db.Column(db.String(64), nullable=True)
+    last_error = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    
+    # Relationships
+    rumor = db.relationship('Rumor', back_populates='finalization_task')
+    
+    __table_args__ = (
+        db.Index('ix_finalization_tasks_available_at', 'available_at'),
+    )
+    
+    def __repr__(self):
+        return f'<FinalizationTask {self.rumor_id[:8]}... attempt {self.attempts}>'
+
+
 class BlockchainLedger(db.Model):
     """Immutable ledger for finalized rumors - blockchain implementation"""
     __tablename__ = 'blockchain_ledger'
@@ -260,6 +369,11 @@ class BlockchainLedger(db.Model):
     timestamp = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     block_data = db.Column(db.JSON, nullable=False)  # Complete immutable record
     
+    # Merkle mode: the row is a leaf (previous_block_hash NULL) sealed into a MerkleBlock
+    merkle_block_id = db.Column(db.Integer, db.ForeignKey('merkle_blocks.id'), nullable=True, index=True)
+    leaf_index = db.Column(db.Integer, nullable=True)
+    merkle_proof = db.Column(db.JSON, nullable=True)  # Sibling path from leaf to root, stored at seal time
+    
     def to_dict(self):
         return {
             'id': self.id,
@@ -275,8 +389,76 @@ class BlockchainLedger(db.Model):
             'underAreaVotes': self.under_area_votes,
             'notUnderAreaVotes': self.not_under_area_votes,
             'timestamp': self.timestamp.isoformat(),
-            'blockData': self.block_data
+            'blockData': self.block_data,
+            'merkleBlockId': self.merkle_block_id,
+            'leafIndex': self.leaf_index
         }
     
     def __repr__(self):
         return f'<Block #{self.id} {self.block_hash[:8]}...>'
+
+
+class MerkleBlock(db.Model):
+    """Chain block sealing a batch of ledger rows (leaves) under one Merkle root"""
+    __tablename__ = 'merkle_blocks'
+    
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    block_hash = db.Column(db.String(64), nullable=False, unique=True)
+    previous_block_hash = db.Column(db.String(64), nullable=False)
+    merkle_root = db.Column(db.String(64), nullable=False)
+    leaf_count = db.Column(db.Integer, nullable=False)
+    timestamp = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'blockHash': self.block_hash,
+            'previousBlockHash': self.previous_block_hash,
+            'merkleRoot': self.merkle_root,
+            'leafCount': self.leaf_count,
+            'timestamp': self.timestamp.isoformat()
+        }
+    
+    def __repr__(self):
+        return f'<MerkleBlock #{self.id} {self.block_hash[:8]}...>'
+
+
+class ChainHead(db.Model):
+    """Single-row pointer to the hash of the last block on the chain, locked by every append"""
+    __tablename__ = 'chain_head'
+    
+    id = db.Column(db.Integer, primary_key=True)  # Always 1
+    block_hash = db.Column(db.String(64), nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    
+    def __repr__(self):
+        return f'<ChainHead {self.block_hash[:8]}...>'
+
+
+class LedgerStats(db.Model):
+    """Single-row running counts of ledger blocks, incremented with every append"""
+    __tablename__ = 'ledger_stats'
+    
+    id = db.Column(db.Integer, primary_key=True)  # Always 1
+    total_blocks = db.Column(db.Integer, default=0, nullable=False)
+    fact_decisions = db.Column(db.Integer, default=0, nullable=False)
+    lie_decisions = db.Column(db.Integer, default=0, nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    
+    def __repr__(self):
+        return f'<LedgerStats {self.total_blocks} block(s)>'
+
+
+class LedgerCheckpoint(db.Model):
+    """Single-row record of the last ledger block whose chain links were verified"""
+    __tablename__ = 'ledger_checkpoints'
+    
+    id = db.Column(db.Integer, primary_key=True)  # Always 1
+    block_id = db.Column(db.Integer, nullable=False)  # 0 (genesis) when only Merkle blocks exist
+    block_hash = db.Column(db.String(64), nullable=False)
+    merkle_block_id = db.Column(db.Integer, nullable=True)
+    merkle_block_hash = db.Column(db.String(64), nullable=True)
+    verified_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    
+    def __repr__(self):
+        return f'<LedgerCheckpoint #{self.block_id} {self.block_hash[:8]}...>'
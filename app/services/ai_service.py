@@ -1,6 +1,9 @@
 import os
 import json
-from typing import Dict, Any
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, Any, Optional
 from openai import AzureOpenAI
 from app.models import AreaEnum
 
@@ -153,10 +156,14 @@ Be strict: only accept genuine rumors with appropriate timing and area selection
             'suggestedArea': suggested_area
         }
     
-    def moderate_decision(self, rumor_data: Dict[str, Any]) -> Dict[str, Any]:
+    def moderate_decision(self, rumor_data: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
         """
         AI moderation to detect anomalies and decide if voting should be extended
         
+        Args:
+            rumor_data: Vote statistics and content of the rumor
+            timeout: Seconds to wait for the AI before using the fallback logic
+        
         Returns:
             {
                 'isAmbiguous': bool,
@@ -218,7 +225,9 @@ Voting Statistics:
 
 Should voting be extended?"""
             
-            response = self.client.chat.completions.create(
+            # No client-side retries: each one would wait out the timeout again
+            client = self.client.with_options(timeout=timeout, max_retries=0) if timeout else self.client
+            response = client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -239,6 +248,49 @@ Should voting be extended?"""
             print(f"AI moderation error: {str(e)}")
             return self._fallback_moderation(rumor_data)
     
+    def moderate_decisions(self, batch: Dict[str, Dict[str, Any]], max_workers: int = 8,
+                           timeout: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Moderate many rumors concurrently
+        
+        Args:
+            batch: {rumor_id: rumor_data} as accepted by moderate_decision
+            max_workers: Upper bound on concurrent AI calls
+            timeout: Per-call timeout in seconds; calls still running when the
+                     batch runs out of time use the fallback logic
+        
+        Returns:
+            {rumor_id: moderation result}
+        """
+        if not batch:
+            return {}
+        
+        if not self.client:
+            return {rumor_id: self._fallback_moderation(data) for rumor_id, data in batch.items()}
+        
+        workers = min(max_workers, len(batch))
+        # Calls beyond max_workers queue behind earlier ones: allow one timeout per wave
+        deadline = time.monotonic() + timeout * math.ceil(len(batch) / workers) if timeout else None
+        
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='ai-moderation')
+        results = {}
+        try:
+            futures = {
+                rumor_id: executor.submit(self.moderate_decision, data, timeout)
+                for rumor_id, data in batch.items()
+            }
+            for rumor_id, future in futures.items():
+                remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+                try:
+                    results[rumor_id] = future.result(timeout=remaining)
+                except FutureTimeoutError:
+                    print(f"  - AI moderation timed out for rumor {rumor_id[:8]}..., using fallback")
+                    results[rumor_id] = self._fallback_moderation(batch[rumor_id])
+        finally:
+            # Do not wait for stuck calls; their results are no longer needed
+            executor.shutdown(wait=False, cancel_futures=True)
+        return results
+    
     def _fallback_moderation(self, rumor_data: Dict[str, Any]) -> Dict[str, Any]:
         """Fallback moderation logic"""
         total_votes = rumor_data.get('total_votes', 0)
@@ -1,8 +1,14 @@
 import hashlib
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, List
+from sqlalchemy import bindparam, create_engine, select, text, update
+from sqlalchemy.exc import SQLAlchemyError
 from app import db
-from app.models import Rumor, BlockchainLedger, DecisionEnum
+from app.models import Rumor, BlockchainLedger, MerkleBlock, ChainHead, LedgerStats, LedgerCheckpoint, DecisionEnum
+from app.config import Config
 
 
 class BlockchainService:
@@ -15,8 +21,27 @@ class BlockchainService:
     
     @staticmethod
     def get_last_block_hash() -> Optional[str]:
-        """Get the hash of the last finalized block"""
-        last_block = BlockchainLedger.query.order_by(
+        """Get the hash of the last block on the chain from the chain head row"""
+        block_hash = db.session.query(ChainHead.block_hash).filter(ChainHead.id == 1).scalar()
+        if block_hash is not None:
+            return block_hash
+        
+        # Ledgers written before the chain head existed, until their next append
+        return BlockchainService._find_chain_tip()
+    
+    @staticmethod
+    def _find_chain_tip() -> Optional[str]:
+        """Find the last block on the chain by scanning the ledger (the last Merkle block once any exist)"""
+        last_merkle_block = db.session.query(MerkleBlock.block_hash).order_by(
+            MerkleBlock.id.desc()
+        ).first()
+        if last_merkle_block:
+            return last_merkle_block.block_hash
+        
+        # Merkle leaves are not chained individually
+        last_block = BlockchainLedger.query.filter(
+            BlockchainLedger.previous_block_hash.isnot(None)
+        ).order_by(
             BlockchainLedger.id.desc()
         ).first()
         
@@ -24,6 +49,33 @@ class BlockchainService:
             return last_block.block_hash
         return None
     
+    @staticmethod
+    def _lock_chain_head() -> ChainHead:
+        """
+        Lock the chain head row for an append, creating it on first use
+        
+        The row lock serializes appends, so concurrent finalizers cannot link
+        to the same tip. On PostgreSQL a transaction-level advisory lock is
+        taken first so nodes cannot race to create the row either.
+        """
+        if db.engine.dialect.name == 'postgresql':
+            db.session.execute(
+                text("SELECT pg_advisory_xact_lock(:key)"),
+                {'key': Config.LEDGER_APPEND_LOCK_KEY}
+            )
+        
+        head = db.session.query(ChainHead).filter(
+            ChainHead.id == 1
+        ).with_for_update().populate_existing().first()
+        
+        if head is None:
+            head = ChainHead(
+                id=1,
+                block_hash=BlockchainService._find_chain_tip() or BlockchainService.get_genesis_hash()
+            )
+            db.session.add(head)
+        return head
+    
     @staticmethod
     def calculate_rumor_hash(
         rumor_id: str,
@@ -36,16 +88,96 @@ class BlockchainService:
         data = f"{rumor_id}{content}{final_decision or ''}{voting_data}{previous_hash}"
         return hashlib.sha256(data.encode()).hexdigest()
     
+    @staticmethod
+    def calculate_block_hash(block_data: Dict[str, Any], previous_hash: str) -> str:
+        """Calculate a block's hash from its stored block_data, as create_block does"""
+        stats = block_data['statistics']
+        total_votes = stats['factVotes'] + stats['lieVotes']
+        voting_data = f"{total_votes}{stats['factVotes']}{stats['lieVotes']}{stats['factWeight']}{stats['lieWeight']}"
+        return BlockchainService.calculate_rumor_hash(
+            block_data['rumor_id'],
+            block_data['content'],
+            block_data['final_decision'],
+            voting_data,
+            previous_hash
+        )
+    
+    @staticmethod
+    def calculate_merkle_block_hash(merkle_root: str, leaf_count: int, previous_hash: str) -> str:
+        """Calculate the chain hash of a Merkle block"""
+        data = f"{merkle_root}{leaf_count}{previous_hash}"
+        return hashlib.sha256(data.encode()).hexdigest()
+    
+    @staticmethod
+    def hash_leaf(block_hash: str) -> str:
+        """Hash a ledger block hash into a Merkle leaf node (0x00 domain tag, as in RFC 6962)"""
+        return hashlib.sha256(b'\x00' + bytes.fromhex(block_hash)).hexdigest()
+    
+    @staticmethod
+    def hash_pair(left: str, right: str) -> str:
+        """Hash two Merkle tree nodes into their parent (0x01 domain tag, as in RFC 6962)"""
+        return hashlib.sha256(b'\x01' + bytes.fromhex(left) + bytes.fromhex(right)).hexdigest()
+    
+    @staticmethod
+    def merkle_levels(leaves: List[str]) -> List[List[str]]:
+        """
+        Build a Merkle tree bottom-up from ledger block hashes
+        
+        Leaves and internal nodes are hashed under different tags, so a node
+        cannot pass for a leaf. An odd node at the end of a level is promoted
+        to the next level unchanged.
+        """
+        levels = [[BlockchainService.hash_leaf(leaf) for leaf in leaves]]
+        while len(levels[-1]) > 1:
+            level = levels[-1]
+            levels.append([
+                BlockchainService.hash_pair(level[i], level[i + 1]) if i + 1 < len(level) else level[i]
+                for i in range(0, len(level), 2)
+            ])
+        return levels
+    
+    @staticmethod
+    def merkle_proof(levels: List[List[str]], index: int) -> List[Dict[str, str]]:
+        """Collect the sibling hashes from the leaf at index up to the root"""
+        proof = []
+        for level in levels[:-1]:
+            sibling = index + 1 if index % 2 == 0 else index - 1
+            if sibling < len(level):
+                proof.append({
+                    'hash': level[sibling],
+                    'position': 'right' if index % 2 == 0 else 'left'
+                })
+            index //= 2
+        return proof
+    
+    @staticmethod
+    def verify_inclusion_proof(leaf_hash: str, proof: List[Dict[str, str]], merkle_root: str) -> bool:
+        """Check a proof from get_inclusion_proof against a Merkle root"""
+        node = BlockchainService.hash_leaf(leaf_hash)
+        for step in proof:
+            if step['position'] == 'left':
+                node = BlockchainService.hash_pair(step['hash'], node)
+            else:
+                node = BlockchainService.hash_pair(node, step['hash'])
+        return node == merkle_root
+    
     @staticmethod
     def create_block(rumor: Rumor) -> BlockchainLedger:
-        """Create a new block in the blockchain ledger for a finalized rumor"""
+        """
+        Create a new block in the blockchain ledger for a finalized rumor
+        
+        With LEDGER_BLOCK_MODE='merkle' the row is an unchained leaf that
+        seal_pending_leaves later commits to the chain under a Merkle root.
+        """
         if not rumor.is_final:
             raise ValueError("Cannot create block for non-finalized rumor")
         
-        # Get previous block hash
-        previous_hash = BlockchainService.get_last_block_hash()
-        if previous_hash is None:
-            previous_hash = BlockchainService.get_genesis_hash()
+        # Get previous block hash, holding the chain head until the caller commits
+        head = None
+        previous_hash = None
+        if Config.LEDGER_BLOCK_MODE != 'merkle':
+            head = BlockchainService._lock_chain_head()
+            previous_hash = head.block_hash
         
         # Calculate statistics
         stats = rumor.get_stats()
@@ -68,14 +200,7 @@ class BlockchainService:
         }
         
         # Calculate block hash
-        voting_data = f"{total_votes}{stats['factVotes']}{stats['lieVotes']}{stats['factWeight']}{stats['lieWeight']}"
-        block_hash = BlockchainService.calculate_rumor_hash(
-            rumor.id,
-            rumor.content,
-            rumor.final_decision.value,
-            voting_data,
-            previous_hash
-        )
+        block_hash = BlockchainService.calculate_block_hash(block_data, previous_hash or '')
         
         # Create blockchain entry
         block = BlockchainLedger(
@@ -94,59 +219,489 @@ class BlockchainService:
         )
         
         db.session.add(block)
+        if head is not None:
+            head.block_hash = block_hash
+        BlockchainService._record_block_stats(rumor.final_decision)
         
         # Update rumor's current hash
         rumor.current_hash = block_hash
-        rumor.previous_hash = previous_hash
+        if previous_hash is not None:
+            rumor.previous_hash = previous_hash
         
         return block
     
     @staticmethod
-    def verify_chain_integrity() -> tuple[bool, Optional[str]]:
-        """Verify the integrity of the entire blockchain"""
-        blocks = BlockchainLedger.query.order_by(BlockchainLedger.id.asc()).all()
+    def _record_block_stats(decision: DecisionEnum) -> None:
+        """
+        Count a new ledger block in ledger_stats inside the caller's transaction
         
-        if not blocks:
-            return True, None
+        Uses an in-database increment so concurrent appends never overwrite
+        each other's counts.
+        """
+        values = {
+            LedgerStats.total_blocks: LedgerStats.total_blocks + 1,
+            LedgerStats.updated_at: datetime.utcnow()
+        }
+        if decision == DecisionEnum.FACT:
+            values[LedgerStats.fact_decisions] = LedgerStats.fact_decisions + 1
+        else:
+            values[LedgerStats.lie_decisions] = LedgerStats.lie_decisions + 1
         
-        # Check first block
-        first_block = blocks[0]
-        expected_genesis = BlockchainService.get_genesis_hash()
-        if first_block.previous_block_hash != expected_genesis:
-            return False, f"First block has invalid genesis hash"
+        updated = LedgerStats.query.filter_by(id=1).update(values, synchronize_session=False)
         
-        # Verify each block links to the previous one
-        for i in range(1, len(blocks)):
-            current_block = blocks[i]
-            previous_block = blocks[i - 1]
+        if not updated:
+            # Ledger predates the counters: seed them from a recount that includes this block
+            db.session.flush()
+            db.session.add(LedgerStats(id=1, **BlockchainService.count_ledger()))
+    
+    @staticmethod
+    def count_ledger() -> Dict[str, int]:
+        """Recount blocks and decisions from the ledger with one aggregate query"""
+        total_blocks, fact_decisions, lie_decisions = db.session.query(
+            db.func.count(BlockchainLedger.id),
+            db.func.sum(db.case((BlockchainLedger.final_decision == DecisionEnum.FACT, 1), else_=0)),
+            db.func.sum(db.case((BlockchainLedger.final_decision == DecisionEnum.LIE, 1), else_=0))
+        ).one()
+        return {
+            'total_blocks': total_blocks,
+            'fact_decisions': int(fact_decisions or 0),
+            'lie_decisions': int(lie_decisions or 0)
+        }
+    
+    @staticmethod
+    def get_ledger_counts() -> Dict[str, int]:
+        """Get block and decision counts from the ledger_stats row (a recount if it does not exist yet)"""
+        row = db.session.query(
+            LedgerStats.total_blocks,
+            LedgerStats.fact_decisions,
+            LedgerStats.lie_decisions
+        ).filter(LedgerStats.id == 1).first()
+        
+        if row is None:
+            return BlockchainService.count_ledger()
+        return {
+            'total_blocks': row.total_blocks,
+            'fact_decisions': row.fact_decisions,
+            'lie_decisions': row.lie_decisions
+        }
+    
+    @staticmethod
+    def seal_pending_leaves() -> Optional[MerkleBlock]:
+        """
+        Append one Merkle block covering every unsealed leaf, inside the caller's transaction
+        
+        Returns:
+            The new block, or None when no leaves are pending
+        """
+        leaves = db.session.query(BlockchainLedger.id, BlockchainLedger.block_hash).filter(
+            BlockchainLedger.previous_block_hash.is_(None),
+            BlockchainLedger.merkle_block_id.is_(None)
+        ).order_by(
+            BlockchainLedger.id
+        ).with_for_update().all()
+        
+        if not leaves:
+            return None
+        
+        # Concurrent sealers append one after another
+        head = BlockchainService._lock_chain_head()
+        previous_hash = head.block_hash
+        
+        levels = BlockchainService.merkle_levels([leaf.block_hash for leaf in leaves])
+        merkle_root = levels[-1][0]
+        block = MerkleBlock(
+            block_hash=BlockchainService.calculate_merkle_block_hash(merkle_root, len(leaves), previous_hash),
+            previous_block_hash=previous_hash,
+            merkle_root=merkle_root,
+            leaf_count=len(leaves)
+        )
+        db.session.add(block)
+        head.block_hash = block.block_hash
+        db.session.flush()
+        
+        ledger = BlockchainLedger.__table__
+        db.session.execute(
+            update(ledger).where(ledger.c.id == bindparam('b_id')).values(
+                merkle_block_id=block.id,
+                leaf_index=bindparam('b_leaf_index'),
+                merkle_proof=bindparam('b_merkle_proof')
+            ),
+            [
+                {
+                    'b_id': leaf.id,
+                    'b_leaf_index': index,
+                    'b_merkle_proof': BlockchainService.merkle_proof(levels, index)
+                }
+                for index, leaf in enumerate(leaves)
+            ]
+        )
+        return block
+    
+    @staticmethod
+    def get_inclusion_proof(rumor_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the Merkle inclusion proof for a rumor's ledger leaf
+        
+        The sibling path is stored when the leaf is sealed, so this reads two
+        rows regardless of block size.
+        
+        Returns:
+            The leaf, its Merkle block and the sibling hashes from leaf to
+            root, or None if the rumor is not sealed in a Merkle block
+        """
+        leaf = BlockchainLedger.query.filter_by(rumor_id=rumor_id).first()
+        if leaf is None or leaf.merkle_block_id is None:
+            return None
+        
+        block = db.session.get(MerkleBlock, leaf.merkle_block_id)
+        return {
+            'rumorId': rumor_id,
+            'leafHash': leaf.block_hash,
+            'leafIndex': leaf.leaf_index,
+            'blockData': leaf.block_data,
+            'merkleBlock': block.to_dict(),
+            'proof': leaf.merkle_proof
+        }
+    
+    @staticmethod
+    def verify_chain_integrity(full: bool = False) -> tuple[bool, Optional[str]]:
+        """
+        Verify the chain links of the blockchain
+        
+        Args:
+            full: Re-verify from the genesis block instead of the last checkpoint
+        
+        Chained ledger rows are walked first, then the Merkle blocks that
+        continue the chain from their tip. Blocks are streamed in batches, so
+        memory stays constant. When every link checks out, the checkpoint moves
+        to the last verified blocks and routine checks only walk blocks
+        appended after them.
+        """
+        expected_previous = BlockchainService.get_genesis_hash()
+        last_id = 0
+        last_merkle_id = 0
+        
+        checkpoint = LedgerCheckpoint.query.filter_by(id=1).populate_existing().first()
+        if checkpoint and not full:
+            # The checkpointed blocks themselves must be unchanged
+            if checkpoint.block_id:
+                block_hash = db.session.query(BlockchainLedger.block_hash).filter(
+                    BlockchainLedger.id == checkpoint.block_id
+                ).scalar()
+                if block_hash != checkpoint.block_hash:
+                    return False, f"Block #{checkpoint.block_id} changed since it was verified"
+                expected_previous = checkpoint.block_hash
+                last_id = checkpoint.block_id
             
-            if current_block.previous_block_hash != previous_block.block_hash:
-                return False, f"Block #{current_block.id} has broken chain link"
+            if checkpoint.merkle_block_id:
+                block_hash = db.session.query(MerkleBlock.block_hash).filter(
+                    MerkleBlock.id == checkpoint.merkle_block_id
+                ).scalar()
+                if block_hash != checkpoint.merkle_block_hash:
+                    return False, f"Merkle block #{checkpoint.merkle_block_id} changed since it was verified"
+                last_merkle_id = checkpoint.merkle_block_id
+        
+        blocks = db.session.query(
+            BlockchainLedger.id,
+            BlockchainLedger.block_hash,
+            BlockchainLedger.previous_block_hash
+        ).filter(
+            BlockchainLedger.id > last_id,
+            BlockchainLedger.previous_block_hash.isnot(None)
+        ).order_by(
+            BlockchainLedger.id.asc()
+        ).yield_per(Config.LEDGER_VERIFY_BATCH_SIZE)
+        
+        for block in blocks:
+            if block.previous_block_hash != expected_previous:
+                if last_id == 0:
+                    return False, f"First block has invalid genesis hash"
+                return False, f"Block #{block.id} has broken chain link"
+            expected_previous = block.block_hash
+            last_id = block.id
+        last_hash = expected_previous
         
+        # Merkle blocks continue the chain from the last chained ledger row
+        if last_merkle_id:
+            expected_previous = checkpoint.merkle_block_hash
+        merkle_blocks = db.session.query(
+            MerkleBlock.id,
+            MerkleBlock.block_hash,
+            MerkleBlock.previous_block_hash
+        ).filter(
+            MerkleBlock.id > last_merkle_id
+        ).order_by(
+            MerkleBlock.id.asc()
+        ).yield_per(Config.LEDGER_VERIFY_BATCH_SIZE)
+        
+        for block in merkle_blocks:
+            if block.previous_block_hash != expected_previous:
+                return False, f"Merkle block #{block.id} has broken chain link"
+            expected_previous = block.block_hash
+            last_merkle_id = block.id
+        
+        BlockchainService._save_checkpoint(
+            last_id, last_hash,
+            last_merkle_id or None, expected_previous if last_merkle_id else None
+        )
         return True, None
     
+    @staticmethod
+    def _save_checkpoint(block_id: int, block_hash: str,
+                         merkle_block_id: Optional[int], merkle_block_hash: Optional[str]) -> None:
+        """
+        Move the verification checkpoint forward
+        
+        Written with an upsert on its own connection, so verifying never
+        commits the caller's session, concurrent verifiers do not collide on
+        the insert, and the checkpoint never moves backwards. Failing to save
+        it only means the next check walks further.
+        """
+        if not block_id and not merkle_block_id:
+            return
+        
+        table = LedgerCheckpoint.__table__
+        values = {
+            'id': 1,
+            'block_id': block_id,
+            'block_hash': block_hash,
+            'merkle_block_id': merkle_block_id,
+            'merkle_block_hash': merkle_block_hash,
+            'verified_at': datetime.utcnow()
+        }
+        
+        dialect = db.engine.dialect.name
+        if dialect == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert
+        elif dialect == 'sqlite':
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            insert = None
+        
+        try:
+            with db.engine.begin() as connection:
+                if insert is None:
+                    # No ON CONFLICT support: replace the row outright
+                    connection.execute(table.delete().where(table.c.id == 1))
+                    connection.execute(table.insert().values(**values))
+                    return
+                
+                stmt = insert(table).values(**values)
+                current_merkle = db.func.coalesce(table.c.merkle_block_id, 0)
+                new_merkle = db.func.coalesce(stmt.excluded.merkle_block_id, 0)
+                connection.execute(stmt.on_conflict_do_update(
+                    index_elements=['id'],
+                    set_={column: stmt.excluded[column] for column in values if column != 'id'},
+                    where=db.and_(
+                        table.c.block_id <= stmt.excluded.block_id,
+                        current_merkle <= new_merkle,
+                        db.or_(table.c.block_id < stmt.excluded.block_id, current_merkle < new_merkle)
+                    )
+                ))
+        except SQLAlchemyError as e:
+            print(f"  - Could not save ledger checkpoint: {str(e)}")
+    
+    @staticmethod
+    def audit_chain(workers: Optional[int] = None,
+                    progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
+        """
+        Recompute every block hash from its block_data and check every link
+        
+        The ledger is split into id ranges of LEDGER_AUDIT_SHARD_SIZE that a
+        process pool verifies in parallel, each streaming its range with its
+        own connection. Shard results are reduced to the first bad block.
+        
+        Args:
+            workers: Number of processes (default: CPU count)
+            progress: Called with (blocks_checked, total_blocks) as shards finish
+        
+        Returns:
+            Report with validity, blocks checked, the first bad block and elapsed time
+        """
+        started = time.monotonic()
+        min_id, max_id, total_blocks = db.session.query(
+            db.func.min(BlockchainLedger.id),
+            db.func.max(BlockchainLedger.id),
+            db.func.count(BlockchainLedger.id)
+        ).one()
+        
+        report = {
+            'valid': True,
+            'totalBlocks': total_blocks,
+            'blocksChecked': 0,
+            'firstBadBlock': None,
+            'firstBadMerkleBlock': None,
+            'error': None,
+            'elapsedSeconds': 0.0
+        }
+        if not total_blocks:
+            return report
+        
+        database_uri = db.engine.url.render_as_string(hide_password=False)
+        shard_size = Config.LEDGER_AUDIT_SHARD_SIZE
+        shards = [
+            (database_uri, start_id, min(start_id + shard_size - 1, max_id), Config.LEDGER_VERIFY_BATCH_SIZE)
+            for start_id in range(min_id, max_id + 1, shard_size)
+        ]
+        
+        results = []
+        with ProcessPoolExecutor(max_workers=min(workers or os.cpu_count() or 1, len(shards))) as executor:
+            futures = [executor.submit(_audit_shard, *shard) for shard in shards]
+            for future in as_completed(futures):
+                result = future.result()
+                results.append(result)
+                report['blocksChecked'] += result['checked']
+                if progress:
+                    progress(report['blocksChecked'], total_blocks)
+        
+        # Reduce: failures inside shards, then links across shard boundaries
+        failures = [(result['bad_id'], result['error']) for result in results if result['bad_id'] is not None]
+        expected_previous = BlockchainService.get_genesis_hash()
+        last_id = 0
+        for result in sorted(results, key=lambda result: result['start_id']):
+            if result['first_id'] is None:
+                continue
+            if result['first_previous'] != expected_previous:
+                failures.append((result['first_id'], f"Block #{result['first_id']} has broken chain link"))
+            expected_previous = result['last_hash']
+            last_id = result['last_id']
+        
+        if failures:
+            bad_id, error = min(failures)
+            report.update(valid=False, firstBadBlock=bad_id, error=error)
+        else:
+            merkle_block_id, merkle_block_hash, error = BlockchainService._audit_merkle_blocks(expected_previous)
+            if error:
+                report.update(valid=False, firstBadMerkleBlock=merkle_block_id, error=error)
+            else:
+                BlockchainService._save_checkpoint(last_id, expected_previous, merkle_block_id, merkle_block_hash)
+        
+        report['elapsedSeconds'] = round(time.monotonic() - started, 2)
+        return report
+    
+    @staticmethod
+    def _audit_merkle_blocks(expected_previous: str) -> tuple[Optional[int], Optional[str], Optional[str]]:
+        """
+        Recompute every Merkle block's root and hash from its leaves and check its link
+        
+        Returns:
+            (last or first bad block id, last block hash, error)
+        """
+        last_id = 0
+        while True:
+            # Plain column tuples: nothing is added to the caller's session
+            blocks = db.session.query(
+                MerkleBlock.id,
+                MerkleBlock.block_hash,
+                MerkleBlock.previous_block_hash,
+                MerkleBlock.merkle_root,
+                MerkleBlock.leaf_count
+            ).filter(
+                MerkleBlock.id > last_id
+            ).order_by(
+                MerkleBlock.id
+            ).limit(Config.LEDGER_VERIFY_BATCH_SIZE).all()
+            if not blocks:
+                break
+            
+            for block in blocks:
+                leaf_hashes = [
+                    block_hash for (block_hash,) in
+                    db.session.query(BlockchainLedger.block_hash).filter(
+                        BlockchainLedger.merkle_block_id == block.id
+                    ).order_by(BlockchainLedger.leaf_index).all()
+                ]
+                if block.previous_block_hash != expected_previous:
+                    return block.id, None, f"Merkle block #{block.id} has broken chain link"
+                if (len(leaf_hashes) != block.leaf_count
+                        or BlockchainService.merkle_levels(leaf_hashes)[-1][0] != block.merkle_root):
+                    return block.id, None, f"Merkle block #{block.id} root does not match its leaves"
+                if BlockchainService.calculate_merkle_block_hash(
+                        block.merkle_root, block.leaf_count, block.previous_block_hash) != block.block_hash:
+                    return block.id, None, f"Merkle block #{block.id} hash does not match its contents"
+                
+                expected_previous = block.block_hash
+                last_id = block.id
+        
+        return (last_id or None), (expected_previous if last_id else None), None
+    
     @staticmethod
     def get_blockchain_stats() -> Dict[str, Any]:
         """Get statistics about the blockchain"""
-        total_blocks = BlockchainLedger.query.count()
-        fact_decisions = BlockchainLedger.query.filter_by(
-            final_decision=DecisionEnum.FACT
-        ).count()
-        lie_decisions = BlockchainLedger.query.filter_by(
-            final_decision=DecisionEnum.LIE
-        ).count()
+        counts = BlockchainService.get_ledger_counts()
         
+        # Walks only the blocks appended since the last checkpoint
         is_valid, error = BlockchainService.verify_chain_integrity()
         
         return {
-            'totalBlocks': total_blocks,
-            'factDecisions': fact_decisions,
-            'lieDecisions': lie_decisions,
+            'totalBlocks': counts['total_blocks'],
+            'factDecisions': counts['fact_decisions'],
+            'lieDecisions': counts['lie_decisions'],
             'chainValid': is_valid,
             'chainError': error
         }
 
 
+def _audit_shard(database_uri: str, start_id: int, end_id: int, batch_size: int) -> Dict[str, Any]:
+    """
+    Verify the blocks with ids in [start_id, end_id] (runs in a worker process)
+    
+    Stops at the first bad block; the boundary hashes let the caller check
+    the links between neighbouring shards.
+    """
+    ledger = BlockchainLedger.__table__
+    engine = create_engine(database_uri)
+    result = {
+        'start_id': start_id,
+        'checked': 0,
+        'bad_id': None,
+        'error': None,
+        'first_id': None,
+        'first_previous': None,
+        'last_id': None,
+        'last_hash': None
+    }
+    
+    try:
+        with engine.connect() as connection:
+            rows = connection.execution_options(yield_per=batch_size).execute(
+                select(ledger.c.id, ledger.c.block_hash, ledger.c.previous_block_hash, ledger.c.block_data).where(
+                    ledger.c.id.between(start_id, end_id)
+                ).order_by(ledger.c.id)
+            )
+            
+            for block_id, block_hash, previous_hash, block_data in rows:
+                result['checked'] += 1
+                
+                if previous_hash is None:
+                    # Merkle leaf: chained through its Merkle block, not by link
+                    if BlockchainService.calculate_block_hash(block_data, '') != block_hash:
+                        result['bad_id'] = block_id
+                        result['error'] = f"Block #{block_id} hash does not match its contents"
+                        break
+                    continue
+                
+                if result['first_id'] is None:
+                    result['first_id'] = block_id
+                    result['first_previous'] = previous_hash
+                elif previous_hash != result['last_hash']:
+                    result['bad_id'] = block_id
+                    result['error'] = f"Block #{block_id} has broken chain link"
+                    break
+                
+                if BlockchainService.calculate_block_hash(block_data, previous_hash) != block_hash:
+                    result['bad_id'] = block_id
+                    result['error'] = f"Block #{block_id} hash does not match its contents"
+                    break
+                
+                result['last_id'] = block_id
+                result['last_hash'] = block_hash
+    finally:
+        engine.dispose()
+    
+    return result
+
+
 def initialize_blockchain():
     """Initialize blockchain - called on app startup"""
     # Nothing specific needed on startup
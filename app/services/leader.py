@@ -0,0 +1,199 @@
+import atexit
+import os
+import threading
+from typing import Callable
+from app import db
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class PostgresAdvisoryLock:
+    """
+    Leadership backed by a session-level PostgreSQL advisory lock
+    
+    The lock lives on a dedicated connection outside the pool, so PostgreSQL
+    releases it as soon as the holding process dies or loses its connection.
+    """
+    
+    def __init__(self, engine, key: int):
+        self.engine = engine
+        self.key = key
+        self._connection = None
+    
+    def try_acquire(self) -> bool:
+        connection = self.engine.raw_connection()
+        connection.detach()
+        try:
+            cursor = connection.cursor()
+            cursor.execute("SELECT pg_try_advisory_lock(%s)", (self.key,))
+            acquired = bool(cursor.fetchone()[0])
+            connection.commit()
+        except Exception:
+            connection.close()
+            raise
+        
+        if acquired:
+            self._connection = connection
+        else:
+            connection.close()
+        return acquired
+    
+    def is_held(self) -> bool:
+        if self._connection is None:
+            return False
+        try:
+            cursor = self._connection.cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+            self._connection.commit()
+            return True
+        except Exception:
+            # Connection dropped: the server has already released the lock
+            self._close()
+            return False
+    
+    def release(self) -> None:
+        if self._connection is None:
+            return
+        try:
+            cursor = self._connection.cursor()
+            cursor.execute("SELECT pg_advisory_unlock(%s)", (self.key,))
+            self._connection.commit()
+        except Exception:
+            pass
+        self._close()
+    
+    def _close(self) -> None:
+        try:
+            self._connection.close()
+        except Exception:
+            pass
+        self._connection = None
+
+
+class FileLock:
+    """
+    Leadership backed by an exclusive OS file lock, for SQLite/dev setups on one host
+    
+    The OS drops the lock when the holding process exits.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+    
+    def try_acquire(self) -> bool:
+        handle = open(self.path, 'a+')
+        try:
+            if fcntl:
+                fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            handle.close()
+            return False
+        
+        handle.seek(0)
+        handle.truncate()
+        handle.write(str(os.getpid()))
+        handle.flush()
+        self._file = handle
+        return True
+    
+    def is_held(self) -> bool:
+        return self._file is not None
+    
+    def release(self) -> None:
+        if self._file is None:
+            return
+        try:
+            if fcntl:
+                fcntl.flock(self._file, fcntl.LOCK_UN)
+            else:
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        except OSError:
+            pass
+        self._file.close()
+        self._file = None
+
+
+class LeaderElector:
+    """
+    Background thread that keeps trying to become (and stay) the leader
+    
+    Calls on_elected when this process wins the lock and on_demoted if it
+    loses it, so exactly one process runs scheduled jobs at a time and a
+    standby takes over within one interval after the leader dies.
+    """
+    
+    def __init__(self, lock, interval: int, on_elected: Callable[[], None], on_demoted: Callable[[], None]):
+        self.lock = lock
+        self.interval = interval
+        self.on_elected = on_elected
+        self.on_demoted = on_demoted
+        self.is_leader = False
+        self._stopped = threading.Event()
+    
+    def start(self) -> None:
+        thread = threading.Thread(target=self._run, name='leader-elector', daemon=True)
+        thread.start()
+        atexit.register(self.stop)
+    
+    def stop(self) -> None:
+        self._stopped.set()
+        if self.is_leader:
+            self._demote()
+        self.lock.release()
+    
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                if self.is_leader:
+                    if not self.lock.is_held():
+                        print(f"✗ Process {os.getpid()} lost scheduler leadership")
+                        self._demote()
+                elif self.lock.try_acquire():
+                    self.is_leader = True
+                    print(f"✓ Process {os.getpid()} elected scheduler leader")
+                    self.on_elected()
+            except Exception as e:
+                print(f"✗ Leader election error: {str(e)}")
+                if self.is_leader:
+                    self._demote()
+                # Never hold the lock while not leading, or no other process can take over
+                self.lock.release()
+            
+            self._stopped.wait(self.interval)
+    
+    def _demote(self) -> None:
+        self.is_leader = False
+        try:
+            self.on_demoted()
+        except Exception as e:
+            print(f"✗ Error while stepping down as leader: {str(e)}")
+
+
+def start_leader_election(app, on_elected: Callable[[], None], on_demoted: Callable[[], None]) -> LeaderElector:
+    """Elect one scheduler leader across all processes sharing this database"""
+    with app.app_context():
+        engine = db.engine
+    
+    if engine.dialect.name == 'postgresql':
+        lock = PostgresAdvisoryLock(engine, app.config['SCHEDULER_LEADER_LOCK_KEY'])
+    else:
+        lock = FileLock(app.config['SCHEDULER_LEADER_LOCK_FILE'])
+    
+    elector = LeaderElector(
+        lock,
+        app.config['SCHEDULER_LEADER_ELECTION_INTERVAL_SECONDS'],
+        on_elected,
+        on_demoted
+    )
+    elector.start()
+    return elector
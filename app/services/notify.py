@@ -0,0 +1,66 @@
+import json
+import select
+import threading
+import time
+from typing import Callable
+from sqlalchemy import text
+
+
+class LocalBackend:
+    """Single-process backend: messages only reach this process"""
+    
+    def publish(self, items: list) -> None:
+        pass
+    
+    def subscribe(self, callback: Callable[[list], None]) -> None:
+        pass
+
+
+class PostgresNotifyBackend:
+    """
+    Broadcasts list messages to every process through PostgreSQL LISTEN/NOTIFY
+    
+    Each subscribed process runs one daemon thread holding a dedicated
+    connection that LISTENs on the channel and hands each message to a callback.
+    """
+    
+    CHUNK_SIZE = 100  # Keeps each payload well under the 8000-byte NOTIFY limit
+    
+    def __init__(self, engine, channel: str):
+        self.engine = engine
+        self.channel = channel
+    
+    def publish(self, items: list) -> None:
+        with self.engine.connect() as connection:
+            for i in range(0, len(items), self.CHUNK_SIZE):
+                connection.execute(
+                    text("SELECT pg_notify(:channel, :payload)"),
+                    {'channel': self.channel, 'payload': json.dumps(items[i:i + self.CHUNK_SIZE])}
+                )
+            connection.commit()
+    
+    def subscribe(self, callback: Callable[[list], None]) -> None:
+        thread = threading.Thread(target=self._listen, args=(callback,), daemon=True)
+        thread.start()
+    
+    def _listen(self, callback: Callable[[list], None]) -> None:
+        while True:
+            try:
+                raw = self.engine.raw_connection()
+                raw.detach()  # Dedicated LISTEN connection, never returned to the pool
+                try:
+                    connection = raw.driver_connection
+                    connection.autocommit = True
+                    connection.cursor().execute(f"LISTEN {self.channel}")
+                    while True:
+                        if select.select([connection], [], [], 60) == ([], [], []):
+                            continue
+                        connection.poll()
+                        while connection.notifies:
+                            notify = connection.notifies.pop(0)
+                            callback(json.loads(notify.payload))
+                finally:
+                    raw.close()
+            except Exception as e:
+                print(f"LISTEN {self.channel} error: {str(e)}")
+                time.sleep(5)
@@ -0,0 +1,128 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterable, Optional
+from app import db
+from app.models import SecretKeyProfile
+from app.services.notify import LocalBackend, PostgresNotifyBackend
+
+
+class ProfileSnapshot:
+    """Read-only copy of the profile fields needed to authorize a request"""
+    
+    __slots__ = ('id', 'secret_key', 'area', 'is_blocked', 'points')
+    
+    def __init__(self, id, secret_key, area, is_blocked, points):
+        self.id = id
+        self.secret_key = secret_key
+        self.area = area
+        self.is_blocked = is_blocked
+        self.points = points
+    
+    @classmethod
+    def from_model(cls, profile: SecretKeyProfile) -> 'ProfileSnapshot':
+        return cls(profile.id, profile.secret_key, profile.area, profile.is_blocked, profile.points)
+    
+    def load(self) -> Optional[SecretKeyProfile]:
+        """Load the full profile row, for handlers that modify it or need other fields"""
+        return db.session.get(SecretKeyProfile, self.id)
+    
+    def __repr__(self):
+        return f'<ProfileSnapshot {self.secret_key[:8]}...>'
+
+
+class ProfileCache:
+    """
+    Process-local TTL + LRU cache of profile snapshots keyed by secret key
+    
+    Entries expire after PROFILE_CACHE_TTL_SECONDS, so a missed invalidation
+    is bounded in time. Code that changes a profile's points or blocked state
+    must call invalidate() after committing.
+    """
+    
+    CHANNEL = 'profile_cache_invalidate'
+    
+    def __init__(self):
+        self.ttl = 0
+        self.max_size = 0
+        self.backend = LocalBackend()
+        self._entries = OrderedDict()  # secret_key -> (snapshot, expires_at)
+        self._keys_by_profile = {}  # profile_id -> secret_key
+        self._lock = threading.Lock()
+    
+    def init_app(self, app) -> None:
+        """Configure from the app; the shared backend needs an app context for the engine"""
+        self.ttl = app.config['PROFILE_CACHE_TTL_SECONDS']
+        self.max_size = app.config['PROFILE_CACHE_MAX_SIZE']
+        
+        backend = app.config['PROFILE_CACHE_BACKEND']
+        if backend == 'postgres':
+            with app.app_context():
+                self.backend = PostgresNotifyBackend(db.engine, self.CHANNEL)
+            self.backend.subscribe(self._evict)
+        else:
+            self.backend = LocalBackend()
+    
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_size > 0
+    
+    def get(self, secret_key: str) -> Optional[ProfileSnapshot]:
+        """Return the cached profile snapshot, loading it from the database on a miss"""
+        if self.enabled:
+            with self._lock:
+                entry = self._entries.get(secret_key)
+                if entry is not None:
+                    if entry[1] > time.monotonic():
+                        self._entries.move_to_end(secret_key)
+                        return entry[0]
+                    self._remove(secret_key)
+        
+        profile = SecretKeyProfile.query.filter_by(secret_key=secret_key).first()
+        if not profile:
+            return None
+        
+        snapshot = ProfileSnapshot.from_model(profile)
+        if self.enabled:
+            with self._lock:
+                self._remove(secret_key)
+                self._entries[secret_key] = (snapshot, time.monotonic() + self.ttl)
+                self._keys_by_profile[snapshot.id] = secret_key
+                while len(self._entries) > self.max_size:
+                    self._remove(next(iter(self._entries)))
+        return snapshot
+    
+    def invalidate(self, profile_ids: Iterable[str]) -> None:
+        """Drop profiles from this process's cache and tell the other processes"""
+        profile_ids = list(set(profile_ids))
+        if not profile_ids:
+            return
+        
+        self._evict(profile_ids)
+        try:
+            self.backend.publish(profile_ids)
+        except Exception as e:
+            # Peers fall back to TTL expiry
+            print(f"Profile cache publish error: {str(e)}")
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_profile.clear()
+    
+    def _evict(self, profile_ids: list) -> None:
+        with self._lock:
+            for profile_id in profile_ids:
+                secret_key = self._keys_by_profile.get(profile_id)
+                if secret_key is not None:
+                    self._remove(secret_key)
+    
+    def _remove(self, secret_key: str) -> None:
+        """Remove one entry; caller holds the lock"""
+        entry = self._entries.pop(secret_key, None)
+        if entry is not None and self._keys_by_profile.get(entry[0].id) == secret_key:
+            del self._keys_by_profile[entry[0].id]
+
+
+# Export cache instance
+profile_cache = ProfileCache()
@@ -1,41 +1,122 @@
-from datetime import datetime, timedelta
+import atexit
+import threading
+from datetime import datetime, timedelta, timezone
+from apscheduler.schedulers.base import STATE_RUNNING
+from sqlalchemy import bindparam, update
 from app import db, scheduler
-from app.models import Rumor, Vote, VoteTypeEnum, DecisionEnum
+from app.models import Rumor, Vote, VoteTally, SecretKeyProfile, VoteTypeEnum, DecisionEnum
 from app.services.ai_service import ai_service
 from app.services.blockchain import blockchain_service
+from app.services.profile_cache import profile_cache
+from app.services.task_queue import finalization_queue
+from app.services.notify import LocalBackend, PostgresNotifyBackend
 from app.config import Config
 
 
-def lock_completed_voting():
-    """Background job to lock voting when voting period ends and threshold is met"""
+LOCK_JOB_PREFIX = 'lock_rumor:'
+LOCK_DEADLINE_CHANNEL = 'rumor_lock_deadlines'
+
+# Set by setup_jobs / init_lock_deadlines
+_app = None
+_deadline_backend = LocalBackend()
+_last_resync_at = None
+
+
+def lock_completed_voting(rumor_ids=None):
+    """
+    Background job to lock voting when voting period ends and threshold is met
+    
+    Args:
+        rumor_ids: Only evaluate these rumors (used by per-rumor deadline jobs)
+    """
     print(f"[{datetime.utcnow()}] Running lock_completed_voting job...")
     
     try:
-        # Find rumors where voting period has ended
-        completed_rumors = Rumor.query.filter(
+        now = datetime.utcnow()
+        
+        # Evaluate every rumor whose voting period has ended and that is due
+        # for a (re-)check against the within-area threshold (30% by default),
+        # straight from the running tallies
+        total_votes = db.func.coalesce(VoteTally.fact_votes + VoteTally.lie_votes, 0)
+        under_area_votes = db.func.coalesce(VoteTally.under_area_votes, 0)
+        meets_threshold = db.and_(
+            total_votes > 0,
+            under_area_votes >= total_votes * Config.WITHIN_AREA_THRESHOLD
+        )
+        query = db.session.query(
+            Rumor.id,
+            Rumor.lock_attempts,
+            under_area_votes,
+            total_votes,
+            db.case((meets_threshold, True), else_=False)
+        ).outerjoin(
+            VoteTally, VoteTally.rumor_id == Rumor.id
+        ).filter(
             Rumor.is_locked == False,
-            Rumor.voting_ends_at < datetime.utcnow()
-        ).all()
+            Rumor.voting_ends_at < now,
+            db.or_(Rumor.lock_evaluated_at.is_(None), Rumor.lock_next_eligible_at <= now)
+        )
+        if rumor_ids is not None:
+            query = query.filter(Rumor.id.in_(rumor_ids))
         
-        locked_count = 0
-        for rumor in completed_rumors:
-            stats = rumor.get_stats()
-            total_votes = stats['totalVotes']
-            under_area_votes = stats['underAreaVotes']
+        qualifying = []
+        backoff = []
+        retries = []
+        retired_count = 0
+        for rumor_id, attempts, under, total, qualifies in query.all():
+            if qualifies:
+                qualifying.append(rumor_id)
+                print(f"  - Locked rumor {rumor_id[:8]}... ({under / total * 100:.1f}% within area)")
+                continue
             
-            # Check if within-area threshold is met (30% by default)
-            if total_votes > 0:
-                within_area_ratio = under_area_votes / total_votes
-                if within_area_ratio >= Config.WITHIN_AREA_THRESHOLD:
-                    rumor.is_locked = True
-                    locked_count += 1
-                    print(f"  - Locked rumor {rumor.id[:8]}... ({within_area_ratio*100:.1f}% within area)")
+            # Votes can no longer arrive, so re-check once for votes that were
+            # still committing at the deadline, then apply the terminal policy
+            attempts = (attempts or 0) + 1
+            next_eligible_at = None
+            if attempts == 1:
+                next_eligible_at = now + timedelta(minutes=Config.LOCK_RECHECK_MINUTES)
+                retries.append((rumor_id, next_eligible_at))
+            elif Config.LOCK_RETRY_TERMINAL_POLICY == 'lock':
+                qualifying.append(rumor_id)
+                print(f"  - Locked rumor {rumor_id[:8]}... after {attempts} check(s) below threshold")
+            else:
+                retired_count += 1
+            backoff.append({'b_id': rumor_id, 'attempts': attempts, 'next_eligible_at': next_eligible_at})
         
-        if locked_count > 0:
-            db.session.commit()
-            print(f"  ✓ Locked {locked_count} rumor(s)")
-        else:
+        if not qualifying and not backoff:
             print(f"  - No rumors to lock")
+            return
+        
+        locked_count = 0
+        if qualifying:
+            # Lock every qualifying rumor with one UPDATE
+            locked_count = Rumor.query.filter(
+                Rumor.id.in_(qualifying),
+                Rumor.is_locked == False
+            ).update({Rumor.is_locked: True}, synchronize_session=False)
+            finalization_queue.enqueue(qualifying)
+        
+        if backoff:
+            rumors = Rumor.__table__
+            db.session.execute(
+                update(rumors).where(rumors.c.id == bindparam('b_id')).values(
+                    lock_attempts=bindparam('attempts'),
+                    lock_evaluated_at=now,
+                    lock_next_eligible_at=bindparam('next_eligible_at')
+                ),
+                backoff
+            )
+        
+        db.session.commit()
+        for rumor_id, next_eligible_at in retries:
+            schedule_rumor_lock(rumor_id, next_eligible_at)
+        
+        if qualifying:
+            print(f"  ✓ Locked {locked_count} rumor(s)")
+        if retries:
+            print(f"  - {len(retries)} rumor(s) below threshold, re-checking later")
+        if retired_count:
+            print(f"  - Retired {retired_count} rumor(s) still below threshold after a re-check")
             
     except Exception as e:
         db.session.rollback()
@@ -43,121 +124,422 @@ def lock_completed_voting():
 
 
 def finalize_decisions():
-    """Background job to finalize decisions and update points"""
+    """
+    Background job to finalize decisions and update points
+    
+    Queues locked rumors that have no finalization task yet (e.g. locked by a
+    script), then drains the queue. On PostgreSQL, worker processes drain it
+    concurrently as well (see start_finalization_workers).
+    """
     print(f"[{datetime.utcnow()}] Running finalize_decisions job...")
     
     try:
-        # Find locked but not finalized rumors
-        locked_rumors = Rumor.query.filter(
-            Rumor.is_locked == True,
-            Rumor.is_final == False
-        ).all()
-        
-        finalized_count = 0
-        extended_count = 0
-        
-        for rumor in locked_rumors:
-            stats = rumor.get_stats()
+        queued = finalization_queue.enqueue()
+        db.session.commit()
+        if queued:
+            print(f"  - Queued {queued} locked rumor(s) for finalization")
+    except Exception as e:
+        db.session.rollback()
+        print(f"  ✗ Error queueing rumors for finalization: {str(e)}")
+    
+    totals = process_finalization_tasks()
+    if any(totals.values()):
+        _print_finalization_totals(totals)
+    else:
+        print(f"  - No rumors to finalize")
+
+
+def process_finalization_tasks():
+    """
+    Claim and process finalization tasks until none are available
+    
+    Tasks are claimed in chunks of FINALIZATION_BATCH_SIZE and every rumor
+    commits in its own transaction, so memory stays bounded and a failure only
+    costs that rumor: its task is retried after a backoff.
+    
+    Returns:
+        Counts of finalized, extended and failed rumors and purged votes
+    """
+    totals = {'finalized': 0, 'extended': 0, 'failed': 0, 'purged_votes': 0}
+    
+    try:
+        while True:
+            rumor_ids = finalization_queue.claim(Config.FINALIZATION_BATCH_SIZE)
+            if not rumor_ids:
+                break
+            _finalize_chunk(rumor_ids, totals)
             
-            # Prepare data for AI moderation
-            moderation_data = {
-                'total_votes': stats['totalVotes'],
-                'fact_weight': stats['factWeight'],
-                'lie_weight': stats['lieWeight'],
-                'under_area_votes': stats['underAreaVotes'],
-                'content': rumor.content
+    except Exception as e:
+        db.session.rollback()
+        print(f"  ✗ Error in finalize_decisions: {str(e)}")
+    
+    if Config.LEDGER_BLOCK_MODE == 'merkle':
+        _seal_ledger_leaves()
+    
+    return totals
+
+
+def _seal_ledger_leaves():
+    """Commit the rumors finalized since the last run to the chain as one Merkle block"""
+    try:
+        block = blockchain_service.seal_pending_leaves()
+        db.session.commit()
+        if block:
+            print(f"  ✓ Sealed {block.leaf_count} rumor(s) into Merkle block #{block.id}")
+    except Exception as e:
+        # Leaves stay pending and are sealed by the next run
+        db.session.rollback()
+        print(f"  ✗ Error sealing ledger leaves: {str(e)}")
+
+
+def _print_finalization_totals(totals):
+    print(
+        f"  ✓ Finalized {totals['finalized']} rumor(s), Extended {totals['extended']} rumor(s), "
+        f"Failed {totals['failed']} rumor(s), Purged {totals['purged_votes']} vote(s)"
+    )
+
+
+def _finalize_chunk(rumor_ids, totals):
+    """Moderate a chunk of claimed rumors, then finalize or extend each one"""
+    candidates = db.session.query(Rumor.id, Rumor.content, Rumor.extension_count).filter(
+        Rumor.id.in_(rumor_ids),
+        Rumor.is_locked == True,
+        Rumor.is_final == False
+    ).all()
+    
+    # Tasks for rumors that were already finalized or extended are done
+    stale_ids = set(rumor_ids) - {candidate.id for candidate in candidates}
+    if stale_ids:
+        finalization_queue.complete(stale_ids)
+    
+    stats_by_rumor = Rumor.get_stats_for([candidate.id for candidate in candidates])
+    
+    # End the read transaction; nothing is held open during the AI calls
+    db.session.commit()
+    
+    # Check with AI moderator for anomalies, concurrently; rumors out of
+    # extensions are resolved by their vote weights without an AI call
+    ai_decisions = {}
+    moderation_batch = {}
+    for candidate in candidates:
+        if (candidate.extension_count or 0) >= Config.MAX_VOTING_EXTENSIONS:
+            ai_decisions[candidate.id] = {
+                'isAmbiguous': False,
+                'shouldExtend': False,
+                'reason': 'Extension limit reached'
             }
-            
-            # Check with AI moderator for anomalies
-            ai_decision = ai_service.moderate_decision(moderation_data)
-            
-            if ai_decision['shouldExtend']:
-                # Extend voting by 24 hours
-                rumor.voting_ends_at = datetime.utcnow() + timedelta(hours=24)
-                rumor.is_locked = False
-                extended_count += 1
-                print(f"  - Extended voting for rumor {rumor.id[:8]}... Reason: {ai_decision['reason']}")
-                continue
-            
-            # Finalize the decision
-            fact_weight = stats['factWeight']
-            lie_weight = stats['lieWeight']
-            
-            if fact_weight > lie_weight:
-                rumor.final_decision = DecisionEnum.FACT
-            else:
-                rumor.final_decision = DecisionEnum.LIE
-            
-            rumor.is_final = True
-            
-            # Update points for voters
-            votes = rumor.votes.all()
-            for vote in votes:
-                profile = vote.profile
-                if vote.vote_type.value == rumor.final_decision.value:
-                    # Correct vote
-                    profile.points += Config.CORRECT_VOTE_POINTS
-                else:
-                    # Incorrect vote
-                    profile.points += Config.INCORRECT_VOTE_PENALTY
-                
-                # Check if profile should be blocked
-                if profile.points <= Config.BLOCKING_THRESHOLD:
-                    profile.is_blocked = True
-            
-            # Penalize rumor poster if it's a LIE
-            if rumor.final_decision == DecisionEnum.LIE:
-                rumor.profile.points += Config.LIE_RUMOR_PENALTY
-                if rumor.profile.points <= Config.BLOCKING_THRESHOLD:
-                    rumor.profile.is_blocked = True
-            
-            # Create blockchain block
+            continue
+        
+        stats = stats_by_rumor[candidate.id]
+        moderation_batch[candidate.id] = {
+            'total_votes': stats['totalVotes'],
+            'fact_weight': stats['factWeight'],
+            'lie_weight': stats['lieWeight'],
+            'under_area_votes': stats['underAreaVotes'],
+            'content': candidate.content
+        }
+    
+    ai_decisions.update(ai_service.moderate_decisions(
+        moderation_batch,
+        max_workers=Config.AI_MODERATION_MAX_WORKERS,
+        timeout=Config.AI_MODERATION_TIMEOUT_SECONDS
+    ))
+    
+    for candidate in candidates:
+        try:
+            _finalize_rumor(candidate.id, stats_by_rumor[candidate.id], ai_decisions[candidate.id], totals)
+        except Exception as e:
+            db.session.rollback()
+            totals['failed'] += 1
+            print(f"  ✗ Error finalizing rumor {candidate.id[:8]}...: {str(e)}")
             try:
-                blockchain_service.create_block(rumor)
-                print(f"  ✓ Finalized rumor {rumor.id[:8]}... as {rumor.final_decision.value} (blockchain block created)")
-                
-                # Delete all votes for this rumor (privacy: votes only exist during voting)
-                vote_count = len(votes)
-                for vote in votes:
-                    db.session.delete(vote)
-                print(f"  ✓ Deleted {vote_count} vote(s) for rumor {rumor.id[:8]}... (privacy maintained)")
-                
-            except Exception as e:
-                print(f"  ✗ Error creating blockchain block: {str(e)}")
-                # Continue anyway, rumor is still finalized
-            
-            finalized_count += 1
+                finalization_queue.fail(candidate.id, str(e))
+            except Exception:
+                # The task becomes claimable again after its visibility timeout
+                db.session.rollback()
+
+
+def _finalize_rumor(rumor_id, stats, ai_decision, totals):
+    """Finalize or extend one locked rumor in its own transaction"""
+    # Re-check under a row lock so a rumor is never finalized twice
+    rumor = Rumor.query.filter(
+        Rumor.id == rumor_id,
+        Rumor.is_locked == True,
+        Rumor.is_final == False
+    ).with_for_update().first()
+    
+    if rumor is None:
+        finalization_queue.complete([rumor_id])
+        db.session.commit()
+        return
+    
+    if ai_decision['shouldExtend'] and (rumor.extension_count or 0) < Config.MAX_VOTING_EXTENSIONS:
+        # Extend voting by 24 hours
+        voting_ends_at = datetime.utcnow() + timedelta(hours=24)
+        rumor.record_extension(voting_ends_at, ai_decision['reason'])
+        rumor.is_locked = False
+        rumor.reset_lock_backoff()
+        extension_count = rumor.extension_count
+        finalization_queue.complete([rumor_id])
+        db.session.commit()
         
-        if finalized_count > 0 or extended_count > 0:
-            db.session.commit()
-            print(f"  ✓ Finalized {finalized_count} rumor(s), Extended {extended_count} rumor(s)")
-        else:
-            print(f"  - No rumors to finalize")
-            
+        schedule_rumor_lock(rumor_id, voting_ends_at)
+        totals['extended'] += 1
+        print(f"  - Extended voting for rumor {rumor_id[:8]}... ({extension_count}/{Config.MAX_VOTING_EXTENSIONS}) Reason: {ai_decision['reason']}")
+        return
+    
+    # Finalize the decision
+    if stats['factWeight'] > stats['lieWeight']:
+        rumor.final_decision = DecisionEnum.FACT
+    else:
+        rumor.final_decision = DecisionEnum.LIE
+    decision = rumor.final_decision.value
+    
+    rumor.is_final = True
+    
+    # Snapshot the tallies before the votes are purged below
+    rumor.final_stats = stats
+    
+    # Update points for voters and the poster
+    changed_profile_ids = _settle_points(rumor)
+    
+    # Create blockchain block; if this fails the whole rumor is retried next run
+    blockchain_service.create_block(rumor)
+    
+    # Delete all votes for this rumor (privacy: votes only exist during voting)
+    vote_count = Vote.query.filter(Vote.rumor_id == rumor_id).delete(synchronize_session=False)
+    
+    finalization_queue.complete([rumor_id])
+    db.session.commit()
+    profile_cache.invalidate(changed_profile_ids)
+    
+    totals['finalized'] += 1
+    totals['purged_votes'] += vote_count
+    print(f"  ✓ Finalized rumor {rumor_id[:8]}... as {decision} (blockchain block created)")
+    print(f"  ✓ Deleted {vote_count} vote(s) for rumor {rumor_id[:8]}... (privacy maintained)")
+
+
+def _settle_points(rumor):
+    """
+    Reward correct voters, penalize incorrect ones and the poster of a LIE
+    
+    Each group is settled with one set-based UPDATE that also blocks profiles
+    falling to BLOCKING_THRESHOLD, instead of loading every voter's profile.
+    
+    Returns:
+        IDs of the profiles whose points changed
+    """
+    profiles = SecretKeyProfile.__table__
+    
+    def adjust_points(delta, profile_filter):
+        new_points = profiles.c.points + delta
+        db.session.execute(
+            update(profiles).where(profile_filter).values(
+                points=new_points,
+                is_blocked=db.case(
+                    (new_points <= Config.BLOCKING_THRESHOLD, True),
+                    else_=profiles.c.is_blocked
+                )
+            )
+        )
+    
+    changed_profile_ids = {
+        profile_id for (profile_id,) in
+        db.session.query(Vote.profile_id).filter(Vote.rumor_id == rumor.id).distinct().all()
+    }
+    
+    correct_vote = VoteTypeEnum(rumor.final_decision.value)
+    for vote_type in VoteTypeEnum:
+        voters = db.select(Vote.profile_id).where(
+            Vote.rumor_id == rumor.id,
+            Vote.vote_type == vote_type
+        )
+        delta = Config.CORRECT_VOTE_POINTS if vote_type == correct_vote else Config.INCORRECT_VOTE_PENALTY
+        adjust_points(delta, profiles.c.id.in_(voters))
+    
+    # Penalize rumor poster if it's a LIE
+    if rumor.final_decision == DecisionEnum.LIE:
+        adjust_points(Config.LIE_RUMOR_PENALTY, profiles.c.id == rumor.profile_id)
+        changed_profile_ids.add(rumor.profile_id)
+    
+    return changed_profile_ids
+
+
+def schedule_rumor_lock(rumor_id, voting_ends_at):
+    """
+    Register (or move) the lock deadline for a rumor (or its next re-check)
+    
+    Adds a one-shot job locally when this process is the leader, and
+    broadcasts the deadline so the leader elsewhere adds it too.
+    """
+    if _is_leader():
+        _add_lock_job(rumor_id, voting_ends_at)
+    try:
+        _deadline_backend.publish([[rumor_id, voting_ends_at.isoformat()]])
     except Exception as e:
-        db.session.rollback()
-        print(f"  ✗ Error in finalize_decisions: {str(e)}")
+        # The periodic resync picks it up instead
+        print(f"  ✗ Error publishing lock deadline: {str(e)}")
+
+
+def rebuild_lock_deadlines(since=None):
+    """
+    Load lock deadlines for unlocked rumors from the database
+    
+    Args:
+        since: Only load deadlines after this time (periodic resync), plus every
+               overdue rumor; None loads all
+    
+    Overdue rumors are evaluated right away, so deadlines moved into the past
+    outside the API (scripts, manual SQL) are still picked up by the resync.
+    Rumors backing off after missing the threshold are loaded at their next
+    re-check; retired rumors are skipped.
+    """
+    global _last_resync_at
+    now = datetime.utcnow()
+    _last_resync_at = now
+    
+    query = db.session.query(Rumor.id, Rumor.voting_ends_at, Rumor.lock_next_eligible_at).filter(
+        Rumor.is_locked == False,
+        Rumor.is_final == False,
+        db.or_(Rumor.lock_evaluated_at.is_(None), Rumor.lock_next_eligible_at.isnot(None))
+    )
+    if since is not None:
+        query = query.filter(db.or_(
+            Rumor.voting_ends_at > since,
+            db.and_(Rumor.lock_evaluated_at.is_(None), Rumor.voting_ends_at <= now),
+            Rumor.lock_next_eligible_at <= now
+        ))
+    
+    count = 0
+    for rumor_id, voting_ends_at, next_eligible_at in query.all():
+        _add_lock_job(rumor_id, next_eligible_at or voting_ends_at)
+        count += 1
+    return count
+
+
+def resume_jobs():
+    """Resume the scheduler and rebuild lock deadlines (called when elected leader)"""
+    # Resume first so deadlines broadcast during the rebuild are not dropped
+    scheduler.resume()
+    with _app.app_context():
+        count = rebuild_lock_deadlines()
+    print(f"  - Loaded {count} pending lock deadline(s)")
+
+
+def pause_jobs():
+    """Pause the scheduler and drop lock deadline jobs (called when demoted)"""
+    scheduler.pause()
+    for job in scheduler.get_jobs():
+        if job.id.startswith(LOCK_JOB_PREFIX):
+            job.remove()
+
+
+def _is_leader():
+    # A paused scheduler still reports running; only the leader's is resumed
+    return scheduler.state == STATE_RUNNING
+
+
+def init_lock_deadlines(app, listen):
+    """
+    Set up deadline broadcasting between processes
+    
+    On PostgreSQL, deadlines registered in any process (e.g. a web-only worker
+    creating a rumor) reach every scheduler process through LISTEN/NOTIFY.
+    """
+    global _app, _deadline_backend
+    _app = app
+    
+    with app.app_context():
+        engine = db.engine
+    
+    if engine.dialect.name == 'postgresql':
+        _deadline_backend = PostgresNotifyBackend(engine, LOCK_DEADLINE_CHANNEL)
+        if listen:
+            _deadline_backend.subscribe(_on_deadline_message)
+
+
+def _on_deadline_message(items):
+    if not _is_leader():
+        return
+    for rumor_id, voting_ends_at in items:
+        _add_lock_job(rumor_id, datetime.fromisoformat(voting_ends_at))
+
+
+def _add_lock_job(rumor_id, voting_ends_at):
+    # voting_ends_at is naive UTC; a short grace lets in-flight votes commit first
+    run_date = voting_ends_at.replace(tzinfo=timezone.utc) + timedelta(
+        seconds=Config.LOCK_DEADLINE_GRACE_SECONDS
+    )
+    scheduler.add_job(
+        func=_lock_rumor_job,
+        trigger='date',
+        run_date=run_date,
+        args=[rumor_id],
+        id=LOCK_JOB_PREFIX + rumor_id,
+        name=f'Lock rumor {rumor_id[:8]}',
+        replace_existing=True,
+        misfire_grace_time=None
+    )
+
+
+def _lock_rumor_job(rumor_id):
+    with _app.app_context():
+        lock_completed_voting([rumor_id])
+
+
+def start_finalization_workers(app):
+    """
+    Start threads that drain the finalization queue in this process
+    
+    Only on PostgreSQL, where SKIP LOCKED lets every worker process claim
+    tasks concurrently; elsewhere the leader's finalize job drains the queue.
+    
+    Returns:
+        Number of worker threads started
+    """
+    with app.app_context():
+        if not finalization_queue.supports_concurrent_workers():
+            return 0
+    
+    stopped = threading.Event()
+    
+    def consume():
+        while not stopped.wait(Config.FINALIZATION_POLL_SECONDS):
+            with app.app_context():
+                totals = process_finalization_tasks()
+            if any(totals.values()):
+                _print_finalization_totals(totals)
+    
+    count = app.config['FINALIZATION_WORKERS']
+    for index in range(count):
+        thread = threading.Thread(target=consume, name=f'finalization-worker-{index}', daemon=True)
+        thread.start()
+    atexit.register(stopped.set)
+    return count
 
 
 def setup_jobs(app):
     """Setup scheduled background jobs"""
     
     # Add application context to jobs
-    def lock_voting_job():
+    def resync_deadlines_job():
         with app.app_context():
-            lock_completed_voting()
+            # Overlap the previous window so nothing slips between runs
+            since = _last_resync_at - timedelta(seconds=Config.LOCK_DEADLINE_GRACE_SECONDS) if _last_resync_at else None
+            rebuild_lock_deadlines(since)
     
     def finalize_job():
         with app.app_context():
             finalize_decisions()
     
-    # Schedule jobs
+    # Rumors are locked by one-shot jobs at each voting_ends_at; the resync
+    # only catches deadlines changed outside the API (e.g. scripts)
     scheduler.add_job(
-        func=lock_voting_job,
+        func=resync_deadlines_job,
         trigger='interval',
-        minutes=Config.VOTING_CHECK_INTERVAL_MINUTES,
-        id='lock_voting',
-        name='Lock completed voting',
+        minutes=Config.LOCK_DEADLINE_RESYNC_MINUTES,
+        id='resync_lock_deadlines',
+        name='Resync rumor lock deadlines',
         replace_existing=True
     )
     
@@ -171,5 +553,5 @@ def setup_jobs(app):
     )
     
     print("✓ Background scheduler jobs configured")
-    print(f"  - Lock voting check: every {Config.VOTING_CHECK_INTERVAL_MINUTES} minutes")
+    print(f"  - Lock voting: at each rumor's voting deadline (resync every {Config.LOCK_DEADLINE_RESYNC_MINUTES} minutes)")
     print(f"  - Finalization check: every {Config.FINALIZATION_CHECK_INTERVAL_MINUTES} minutes")
@@ -0,0 +1,237 @@
+from datetime import datetime
+from typing import Any, Dict, Optional, Iterable
+from sqlalchemy import bindparam, update
+from sqlalchemy.exc import IntegrityError
+from app import db
+from app.models import Rumor, Vote, VoteTally, VoteTypeEnum
+
+
+class TallyService:
+    """Service to maintain running per-rumor vote tallies"""
+    
+    @staticmethod
+    def record_vote(rumor_id: str, vote_type: VoteTypeEnum, weight: float, is_within_area: bool) -> None:
+        """
+        Add one vote to a rumor's tally inside the caller's transaction
+        
+        Uses an in-database increment so concurrent voters never overwrite
+        each other's counts. The caller commits together with the Vote insert.
+        """
+        is_fact = vote_type == VoteTypeEnum.FACT
+        values = {VoteTally.updated_at: datetime.utcnow()}
+        
+        if is_fact:
+            values[VoteTally.fact_votes] = VoteTally.fact_votes + 1
+            values[VoteTally.fact_weight] = VoteTally.fact_weight + weight
+        else:
+            values[VoteTally.lie_votes] = VoteTally.lie_votes + 1
+            values[VoteTally.lie_weight] = VoteTally.lie_weight + weight
+        
+        if is_within_area:
+            values[VoteTally.under_area_votes] = VoteTally.under_area_votes + 1
+        else:
+            values[VoteTally.not_under_area_votes] = VoteTally.not_under_area_votes + 1
+        
+        updated = VoteTally.query.filter_by(rumor_id=rumor_id).update(
+            values, synchronize_session=False
+        )
+        
+        if updated:
+            return
+        
+        # Rumor predates tallies (or was inserted outside create_rumor)
+        inserted = TallyService._insert_tally({
+            'rumor_id': rumor_id,
+            'fact_votes': 1 if is_fact else 0,
+            'lie_votes': 0 if is_fact else 1,
+            'fact_weight': weight if is_fact else 0.0,
+            'lie_weight': 0.0 if is_fact else weight,
+            'under_area_votes': 1 if is_within_area else 0,
+            'not_under_area_votes': 0 if is_within_area else 1
+        })
+        if not inserted:
+            # A concurrent voter created the row first: add to it instead
+            VoteTally.query.filter_by(rumor_id=rumor_id).update(values, synchronize_session=False)
+    
+    @staticmethod
+    def _insert_tally(row: Dict[str, Any]) -> bool:
+        """
+        Insert a tally row unless one already exists for the rumor
+        
+        Returns:
+            True if the row was inserted, False if another transaction created it first
+        """
+        table = VoteTally.__table__
+        dialect = db.session.get_bind().dialect.name
+        if dialect == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert
+        elif dialect == 'sqlite':
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            # No ON CONFLICT support: insert inside a savepoint
+            try:
+                with db.session.begin_nested():
+                    db.session.execute(table.insert().values(**row))
+                return True
+            except IntegrityError:
+                return False
+        
+        result = db.session.execute(
+            insert(table).values(**row).on_conflict_do_nothing(index_elements=['rumor_id'])
+        )
+        return result.rowcount == 1
+    
+    @staticmethod
+    def record_votes(votes: Iterable[Dict[str, Any]]) -> None:
+        """
+        Add many votes to their rumors' tallies inside the caller's transaction
+        
+        Args:
+            votes: Vote rows with rumor_id, vote_type, weight and is_within_area
+        
+        Deltas are summed per rumor and applied with one executemany UPDATE.
+        """
+        deltas = {}
+        for vote in votes:
+            delta = deltas.setdefault(vote['rumor_id'], {
+                'd_fact_votes': 0, 'd_lie_votes': 0,
+                'd_fact_weight': 0.0, 'd_lie_weight': 0.0,
+                'd_under_area_votes': 0, 'd_not_under_area_votes': 0
+            })
+            if vote['vote_type'] == VoteTypeEnum.FACT:
+                delta['d_fact_votes'] += 1
+                delta['d_fact_weight'] += vote['weight']
+            else:
+                delta['d_lie_votes'] += 1
+                delta['d_lie_weight'] += vote['weight']
+            if vote['is_within_area']:
+                delta['d_under_area_votes'] += 1
+            else:
+                delta['d_not_under_area_votes'] += 1
+        
+        if not deltas:
+            return
+        
+        existing = {
+            rumor_id for (rumor_id,) in
+            db.session.query(VoteTally.rumor_id).filter(VoteTally.rumor_id.in_(list(deltas))).all()
+        }
+        
+        for rumor_id, delta in deltas.items():
+            if rumor_id in existing:
+                continue
+            if TallyService._insert_tally(dict(
+                    rumor_id=rumor_id,
+                    **{field[2:]: value for field, value in delta.items()})):
+                continue
+            # A concurrent voter created the row first: add to it instead
+            existing.add(rumor_id)
+        
+        params = [
+            dict(delta, b_rumor_id=rumor_id)
+            for rumor_id, delta in deltas.items() if rumor_id in existing
+        ]
+        if params:
+            stmt = update(VoteTally.__table__).where(
+                VoteTally.__table__.c.rumor_id == bindparam('b_rumor_id')
+            ).values(
+                fact_votes=VoteTally.__table__.c.fact_votes + bindparam('d_fact_votes'),
+                lie_votes=VoteTally.__table__.c.lie_votes + bindparam('d_lie_votes'),
+                fact_weight=VoteTally.__table__.c.fact_weight + bindparam('d_fact_weight'),
+                lie_weight=VoteTally.__table__.c.lie_weight + bindparam('d_lie_weight'),
+                under_area_votes=VoteTally.__table__.c.under_area_votes + bindparam('d_under_area_votes'),
+                not_under_area_votes=VoteTally.__table__.c.not_under_area_votes + bindparam('d_not_under_area_votes'),
+                updated_at=datetime.utcnow()
+            )
+            db.session.execute(stmt, params)
+    
+    @staticmethod
+    def count_votes(rumor_ids: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, float]]:
+        """Recount tallies from the votes table with one grouped aggregate query"""
+        is_fact = Vote.vote_type == VoteTypeEnum.FACT
+        is_lie = Vote.vote_type == VoteTypeEnum.LIE
+        query = db.session.query(
+            Vote.rumor_id,
+            db.func.sum(db.case((is_fact, 1), else_=0)),
+            db.func.sum(db.case((is_lie, 1), else_=0)),
+            db.func.sum(db.case((is_fact, Vote.weight), else_=0.0)),
+            db.func.sum(db.case((is_lie, Vote.weight), else_=0.0)),
+            db.func.sum(db.case((Vote.is_within_area == True, 1), else_=0)),
+            db.func.sum(db.case((Vote.is_within_area == False, 1), else_=0)),
+        )
+        
+        if rumor_ids is not None:
+            query = query.filter(Vote.rumor_id.in_(list(rumor_ids)))
+        
+        counts = {}
+        for row in query.group_by(Vote.rumor_id).all():
+            counts[row[0]] = {
+                'fact_votes': int(row[1] or 0),
+                'lie_votes': int(row[2] or 0),
+                'fact_weight': float(row[3] or 0),
+                'lie_weight': float(row[4] or 0),
+                'under_area_votes': int(row[5] or 0),
+                'not_under_area_votes': int(row[6] or 0)
+            }
+        return counts
+    
+    @staticmethod
+    def reconcile(fix: bool = True) -> Dict[str, Dict[str, tuple]]:
+        """
+        Compare tallies of unfinalized rumors against a recount of their votes
+        
+        Finalized rumors are skipped because their votes have been purged.
+        
+        Returns:
+            {rumor_id: {field: (tally_value, recounted_value)}} for every mismatch
+        """
+        rumor_ids = [
+            rumor_id for (rumor_id,) in
+            db.session.query(Rumor.id).filter(Rumor.is_final == False).all()
+        ]
+        if not rumor_ids:
+            return {}
+        
+        counts = TallyService.count_votes(rumor_ids)
+        tallies = {
+            tally.rumor_id: tally
+            for tally in VoteTally.query.filter(VoteTally.rumor_id.in_(rumor_ids)).all()
+        }
+        empty = dict.fromkeys(
+            ('fact_votes', 'lie_votes', 'fact_weight', 'lie_weight',
+             'under_area_votes', 'not_under_area_votes'), 0
+        )
+        
+        mismatches = {}
+        for rumor_id in rumor_ids:
+            expected = counts.get(rumor_id, empty)
+            tally = tallies.get(rumor_id)
+            if tally is None and rumor_id not in counts:
+                # No row and no votes: nothing to rebuild
+                continue
+            
+            diff = {}
+            for field, value in expected.items():
+                current = getattr(tally, field) if tally else None
+                if current is None or abs(current - value) > 1e-6:
+                    diff[field] = (current, value)
+            
+            if not diff:
+                continue
+            mismatches[rumor_id] = diff
+            
+            if fix:
+                if tally is None:
+                    db.session.add(VoteTally(rumor_id=rumor_id, **expected))
+                else:
+                    for field, value in expected.items():
+                        setattr(tally, field, value)
+        
+        if fix:
+            db.session.commit()
+        
+        return mismatches
+
+
+# Export service instance
+tally_service = TallyService()
@@ -0,0 +1,112 @@
+import os
+import socket
+import threading
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional
+from sqlalchemy import insert, select
+from app import db
+from app.models import Rumor, FinalizationTask
+from app.config import Config
+
+
+class FinalizationQueue:
+    """
+    Durable queue of locked rumors waiting to be finalized
+    
+    On PostgreSQL any number of worker processes claim tasks concurrently with
+    FOR UPDATE SKIP LOCKED. Elsewhere (SQLite, single node) claims are
+    serialized in-process and only the scheduler leader consumes the queue.
+    
+    A claim pushes available_at out by the visibility timeout, so a task whose
+    worker dies becomes claimable again. Failed tasks back off exponentially
+    and are left in the table with their last error after too many attempts.
+    """
+    
+    def __init__(self):
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._claim_lock = threading.Lock()
+    
+    @staticmethod
+    def supports_concurrent_workers() -> bool:
+        return db.engine.dialect.name == 'postgresql'
+    
+    def enqueue(self, rumor_ids: Optional[Iterable[str]] = None) -> int:
+        """
+        Add tasks for locked, unfinalized rumors that have none, inside the caller's transaction
+        
+        Args:
+            rumor_ids: Only consider these rumors; None sweeps every locked rumor
+        
+        Returns:
+            Number of tasks added
+        """
+        now = datetime.utcnow()
+        query = select(Rumor.id, db.literal(0), db.literal(now), db.literal(now)).where(
+            Rumor.is_locked == True,
+            Rumor.is_final == False,
+            ~select(FinalizationTask.rumor_id).where(
+                FinalizationTask.rumor_id == Rumor.id
+            ).exists()
+        )
+        if rumor_ids is not None:
+            rumor_ids = list(rumor_ids)
+            if not rumor_ids:
+                return 0
+            query = query.where(Rumor.id.in_(rumor_ids))
+        
+        result = db.session.execute(
+            insert(FinalizationTask).from_select(['rumor_id', 'attempts', 'available_at', 'created_at'], query)
+        )
+        return result.rowcount or 0
+    
+    def claim(self, limit: int) -> List[str]:
+        """
+        Claim up to limit available tasks and commit the claim
+        
+        Returns:
+            Rumor IDs now owned by this worker until the visibility timeout
+        """
+        with self._claim_lock:
+            now = datetime.utcnow()
+            tasks = FinalizationTask.query.filter(
+                FinalizationTask.available_at <= now,
+                FinalizationTask.attempts < Config.FINALIZATION_MAX_ATTEMPTS
+            ).order_by(
+                FinalizationTask.available_at
+            ).limit(limit).with_for_update(skip_locked=True).all()
+            
+            visible_again_at = now + timedelta(seconds=Config.FINALIZATION_VISIBILITY_TIMEOUT_SECONDS)
+            for task in tasks:
+                task.attempts += 1
+                task.available_at = visible_again_at
+                task.claimed_by = self.worker_id
+            
+            rumor_ids = [task.rumor_id for task in tasks]
+            db.session.commit()
+            return rumor_ids
+    
+    def complete(self, rumor_ids: Iterable[str]) -> None:
+        """Remove processed tasks inside the caller's transaction"""
+        FinalizationTask.query.filter(
+            FinalizationTask.rumor_id.in_(list(rumor_ids))
+        ).delete(synchronize_session=False)
+    
+    def fail(self, rumor_id: str, error: str) -> None:
+        """Record a failed attempt and make the task claimable again after a backoff"""
+        task = db.session.get(FinalizationTask, rumor_id)
+        if task is None:
+            return
+        
+        task.last_error = error[:2000]
+        task.claimed_by = None
+        task.available_at = datetime.utcnow() + timedelta(
+            seconds=Config.FINALIZATION_RETRY_BASE_SECONDS * 2 ** (task.attempts - 1)
+        )
+        db.session.commit()
+        
+        if task.attempts >= Config.FINALIZATION_MAX_ATTEMPTS:
+            print(f"  ✗ Giving up on finalizing rumor {rumor_id[:8]}... after {task.attempts} attempt(s)")
+
+
+# Export queue instance
+finalization_queue = FinalizationQueue()
@@ -1,5 +1,7 @@
+import base64
 import hashlib
 import secrets
+from datetime import datetime
 from werkzeug.security import generate_password_hash, check_password_hash
 
 
@@ -34,3 +36,20 @@ def calculate_vote_weight(user_area, rumor_area) -> float:
 def hash_data(data: str) -> str:
     """Generate SHA-256 hash of data"""
     return hashlib.sha256(data.encode()).hexdigest()
+
+
+def encode_cursor(posted_at: datetime, record_id: str) -> str:
+    """Encode a (posted_at, id) keyset position as an opaque pagination cursor"""
+    raw = f"{posted_at.isoformat()}|{record_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Decode a pagination cursor back into its (posted_at, id) keyset position"""
+    padded = cursor + '=' * (-len(cursor) % 4)
+    try:
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        posted_at_str, record_id = raw.split('|', 1)
+        return datetime.fromisoformat(posted_at_str), record_id
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
@@ -9,6 +9,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 from datetime import datetime, timedelta
 from app import create_app, db
 from app.models import Rumor
+from app.services.scheduler import schedule_rumor_lock
 
 
 def list_rumors():
@@ -54,15 +55,17 @@ def end_voting(rumor, hours_ago=1):
     """Set a rumor's voting_ends_at to the past"""
     old_time = rumor.voting_ends_at
     rumor.voting_ends_at = datetime.utcnow() - timedelta(hours=hours_ago)
+    rumor.reset_lock_backoff()
     
     db.session.commit()
+    schedule_rumor_lock(rumor.id, rumor.voting_ends_at)
     
     print(f"\n✅ Voting period ended successfully!")
     print(f"   Old voting end time: {old_time.strftime('%Y-%m-%d %H:%M')}")
     print(f"   New voting end time: {rumor.voting_ends_at.strftime('%Y-%m-%d %H:%M')}")
     print(f"   (Set to {hours_ago} hour(s) ago)")
-    print(f"\n📌 The scheduler will process this rumor in the next check cycle:")
-    print(f"   - Lock voting check: every 5 minutes")
+    print(f"\n📌 The scheduler will process this rumor:")
+    print(f"   - Lock voting: immediately (deadline already passed)")
     print(f"   - Finalization check: every 10 minutes")
 
 
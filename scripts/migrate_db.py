@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Database migration script
+Adds columns and indexes introduced after a database was created and backfills
+their data (db.create_all() only creates missing tables, it never alters existing ones)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from sqlalchemy import inspect, text
+from app import create_app, db
+from app.models import Rumor, BlockchainLedger
+from app.services.tally import tally_service
+
+
+def add_missing_columns():
+    """Add model columns that are missing from existing tables"""
+    inspector = inspect(db.engine)
+    dialect = db.engine.dialect
+    added = 0
+    
+    for table in db.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        
+        existing = {column['name'] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            
+            ddl = f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column.type.compile(dialect=dialect)}"
+            default = column.default.arg if column.default is not None and column.default.is_scalar else None
+            if default is not None:
+                literal = str(default).upper() if isinstance(default, bool) else repr(default)
+                ddl += f" DEFAULT {literal}"
+            if not column.nullable and default is not None:
+                ddl += " NOT NULL"
+            
+            db.session.execute(text(ddl))
+            added += 1
+            print(f"  ✓ Added {table.name}.{column.name}")
+    
+    db.session.commit()
+    if added == 0:
+        print("  - Schema already up to date")
+
+
+def create_missing_indexes():
+    """Create model indexes that are missing from existing tables"""
+    inspector = inspect(db.engine)
+    created = 0
+    
+    for table in db.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        
+        existing = {index['name'] for index in inspector.get_indexes(table.name)}
+        for index in sorted(table.indexes, key=lambda index: index.name):
+            if index.name in existing:
+                continue
+            
+            columns = ', '.join(column.name for column in index.columns)
+            unique = 'UNIQUE ' if index.unique else ''
+            db.session.execute(text(
+                f"CREATE {unique}INDEX IF NOT EXISTS {index.name} ON {table.name} ({columns})"
+            ))
+            created += 1
+            print(f"  ✓ Created index {index.name}")
+    
+    db.session.commit()
+    if created == 0:
+        print("  - Indexes already up to date")
+
+
+def backfill_final_stats():
+    """Copy finalized vote tallies from the ledger onto rumors finalized before snapshots existed"""
+    rumors = Rumor.query.filter(
+        Rumor.is_final == True,
+        Rumor.final_stats.is_(None)
+    ).all()
+    
+    filled = 0
+    for rumor in rumors:
+        block = BlockchainLedger.query.filter_by(rumor_id=rumor.id).first()
+        if block and block.block_data.get('statistics'):
+            rumor.final_stats = block.block_data['statistics']
+            filled += 1
+    
+    db.session.commit()
+    print(f"  ✓ Backfilled stats snapshot for {filled} finalized rumor(s)")
+
+
+def backfill_vote_tallies():
+    """Build running tallies for unfinalized rumors created before tallies existed"""
+    rebuilt = tally_service.reconcile(fix=True)
+    print(f"  ✓ Rebuilt vote tallies for {len(rebuilt)} rumor(s)")
+
+
+def migrate_db():
+    """Bring an existing database up to the current schema"""
+    print("Migrating database...")
+    # No scheduler: jobs must not query columns this script has not added yet
+    app = create_app(role='web')
+    
+    with app.app_context():
+        add_missing_columns()
+        create_missing_indexes()
+        backfill_final_stats()
+        backfill_vote_tallies()
+        print("\n✓ Database migration complete!")
+
+
+if __name__ == '__main__':
+    migrate_db()
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Reconcile vote tallies
+Recounts votes for every unfinalized rumor and rebuilds any vote_tallies row that drifted
+
+Usage:
+    python scripts/reconcile_tallies.py          # report and fix mismatches
+    python scripts/reconcile_tallies.py --check  # report only
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from app import create_app
+from app.services.tally import tally_service
+
+
+def reconcile_tallies(fix=True):
+    """Compare running tallies against the votes table"""
+    app = create_app(role='web')
+    
+    with app.app_context():
+        mismatches = tally_service.reconcile(fix=fix)
+        
+        if not mismatches:
+            print("✓ All vote tallies match the votes table")
+            return 0
+        
+        for rumor_id, diff in mismatches.items():
+            print(f"\nRumor {rumor_id[:8]}...")
+            for field, (current, expected) in diff.items():
+                print(f"  {field}: tally={current} votes={expected}")
+        
+        action = "Rebuilt" if fix else "Found"
+        print(f"\n{'✓' if fix else '✗'} {action} {len(mismatches)} mismatched tally row(s)")
+        return 0 if fix else 1
+
+
+if __name__ == '__main__':
+    sys.exit(reconcile_tallies(fix='--check' not in sys.argv))
@@ -9,6 +9,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 from datetime import datetime, timedelta
 from app import create_app, db
 from app.models import Rumor
+from app.services.scheduler import schedule_rumor_lock
 
 
 def list_active_rumors():
@@ -55,8 +56,10 @@ def trigger_lock(rumor, seconds=5):
     """Set rumor to expire in X seconds to trigger lock"""
     old_time = rumor.voting_ends_at
     rumor.voting_ends_at = datetime.utcnow() + timedelta(seconds=seconds)
+    rumor.reset_lock_backoff()
     
     db.session.commit()
+    schedule_rumor_lock(rumor.id, rumor.voting_ends_at)
     
     print(f"\n✅ Rumor set to trigger lock!")
     print(f"   Old voting end time: {old_time.strftime('%Y-%m-%d %H:%M:%S')}")
@@ -64,17 +67,20 @@ def trigger_lock(rumor, seconds=5):
     print(f"   Time until expiration: {seconds} seconds")
     print(f"\n📌 What happens next:")
     print(f"   1. Wait {seconds} seconds for voting to expire")
-    print(f"   2. Scheduler checks every 5 minutes and will lock the rumor")
+    print(f"   2. Scheduler locks the rumor a few seconds after it expires")
     print(f"   3. After locking, another check (every 10 min) will finalize it")
-    print(f"\n💡 TIP: Restart the server to trigger scheduler checks immediately")
+    print(f"\n💡 TIP: Without PostgreSQL the running server picks up the new deadline at its next resync")
 
 
 def trigger_lock_all(rumors, seconds=5):
     """Set all rumors to expire in X seconds"""
     for rumor in rumors:
         rumor.voting_ends_at = datetime.utcnow() + timedelta(seconds=seconds)
+        rumor.reset_lock_backoff()
     
     db.session.commit()
+    for rumor in rumors:
+        schedule_rumor_lock(rumor.id, rumor.voting_ends_at)
     
     print(f"\n✅ Set {len(rumors)} rumor(s) to expire in {seconds} seconds!")
 
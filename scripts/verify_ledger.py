@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Verify blockchain ledger integrity
+Checks the previous_block_hash links of every block appended since the last
+verified checkpoint, or of the whole chain with --full. --audit also
+recomputes every block hash from its stored data, across a process pool.
+
+Usage:
+    python scripts/verify_ledger.py                      # verify new blocks since the checkpoint
+    python scripts/verify_ledger.py --full               # re-verify the chain from the genesis block
+    python scripts/verify_ledger.py --audit [--workers N]  # recompute every block hash in parallel
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from app import create_app, db
+from app.models import LedgerCheckpoint
+from app.services.blockchain import blockchain_service
+
+
+def print_progress(checked, total):
+    print(f"  ... {checked}/{total} blocks verified ({checked / total * 100:.1f}%)")
+
+
+def audit_ledger(workers=None):
+    """Recompute every block hash and report the first bad block"""
+    app = create_app(role='web')
+    
+    with app.app_context():
+        print("Auditing ledger...")
+        report = blockchain_service.audit_chain(workers=workers, progress=print_progress)
+        
+        if not report['valid']:
+            print(f"✗ Ledger audit failed: {report['error']}")
+            return 1
+        
+        print(f"✓ All {report['totalBlocks']} block(s) valid ({report['elapsedSeconds']}s)")
+        return 0
+
+
+def verify_ledger(full=False):
+    """Verify chain links and report the checkpoint"""
+    app = create_app(role='web')
+    
+    with app.app_context():
+        is_valid, error = blockchain_service.verify_chain_integrity(full=full)
+        
+        if not is_valid:
+            print(f"✗ Ledger verification failed: {error}")
+            return 1
+        
+        checkpoint = db.session.get(LedgerCheckpoint, 1)
+        if checkpoint:
+            print(f"✓ Ledger chain links valid up to block #{checkpoint.block_id} ({checkpoint.block_hash[:8]}...)")
+        else:
+            print("✓ Ledger is empty")
+        return 0
+
+
+if __name__ == '__main__':
+    if '--audit' in sys.argv:
+        workers = int(sys.argv[sys.argv.index('--workers') + 1]) if '--workers' in sys.argv else None
+        sys.exit(audit_ledger(workers))
+    sys.exit(verify_ledger(full='--full' in sys.argv))
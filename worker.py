@@ -0,0 +1,24 @@
+"""
+Background worker entry point
+Runs the scheduled jobs (vote locking, finalization) in a process of its own,
+so they do not compete with web request threads for the GIL or the DB pool.
+
+Run the API with role 'web' alongside this worker:
+    gunicorn "app:create_app('production', role='web')"
+    python worker.py
+"""
+import os
+import signal
+import threading
+from app import create_app
+
+app = create_app(role='worker')
+
+if __name__ == '__main__':
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+    
+    print(f"✓ Worker {os.getpid()} started")
+    stop.wait()
+    print(f"✓ Worker {os.getpid()} shutting down")